@@ -0,0 +1,140 @@
+from math import asin, cos, hypot, radians, sin, sqrt
+
+from graphs.shortest_paths import _heap_search, _trace, shortest_path_lengths
+
+
+def a_star(g, s, t, heuristic):
+    """Compute a shortest path from vertex s to vertex t with A* search.
+
+    heuristic(v) must return a lower bound on the distance from v to t
+    (for instance, one of the heuristics built below); with a heuristic
+    that is always zero, the search is Dijkstra's algorithm.
+
+    Return a (distance, path, settled) tuple, where path is the list of
+    vertices from s to t, or empty if t is unreachable (distance is then
+    infinite), and settled is the number of vertices removed from the queue.
+    """
+    cloud, parent = _heap_search(g, [s], target=t, heuristic=heuristic)
+    if t not in cloud:
+        return float('inf'), [], len(cloud)
+    return cloud[t], _trace(parent, t), len(cloud)
+
+
+def _element(v):
+    """Default coordinate accessor: the vertex element itself."""
+    return v.element()
+
+
+def euclidean_heuristic(t, coordinates=_element, scale=1):
+    """Return a heuristic giving the straight-line distance from a vertex to t.
+
+    coordinates(v) returns an (x, y) pair for vertex v; by default it is
+    v.element(). The distance is multiplied by scale, which must keep it
+    below the true path weight for the search to remain exact.
+    """
+    tx, ty = coordinates(t)
+
+    def heuristic(v):
+        x, y = coordinates(v)
+        return scale * hypot(x - tx, y - ty)
+    return heuristic
+
+
+def haversine_heuristic(t, coordinates=_element, radius=6371.0):
+    """Return a heuristic giving the great-circle distance from a vertex to t.
+
+    coordinates(v) returns a (latitude, longitude) pair in degrees; by
+    default it is v.element(). The result is in the units of radius, which
+    defaults to the mean radius of the Earth in kilometers.
+    """
+    lat, lon = coordinates(t)
+    t_lat, t_lon, t_cos = radians(lat), radians(lon), cos(radians(lat))
+
+    def heuristic(v):
+        lat, lon = coordinates(v)
+        v_lat, v_lon = radians(lat), radians(lon)
+        h = sin((v_lat - t_lat) / 2) ** 2 + cos(v_lat) * t_cos * sin((v_lon - t_lon) / 2) ** 2
+        return 2 * radius * asin(min(1.0, sqrt(h)))
+    return heuristic
+
+
+class Landmarks:
+    """Precomputed landmark distances for the ALT (A*, landmarks, triangle inequality) heuristic."""
+
+    def __init__(self, g, k=4, landmarks=None):
+        """Compute distance tables to and from each landmark of weighted graph g.
+
+        If landmarks is not given, k landmarks are chosen greedily, each
+        one as far as possible from those already chosen.
+        """
+        self._directed = g.is_directed()
+        self._from = []  # _from[i][v] is the distance from landmark i to v
+        self._to = []  # _to[i][v] is the distance from v to landmark i
+        if landmarks is None:
+            landmarks = self._select(g, k)
+        else:
+            landmarks = list(landmarks)  # may be a one-pass iterator
+            for L in landmarks:
+                self._add(g, L)
+        self._landmarks = landmarks
+
+    def _add(self, g, L):
+        """Compute and store the distance tables of landmark L."""
+        self._from.append(shortest_path_lengths(g, L, 'heap'))
+        if self._directed:
+            self._to.append(shortest_path_lengths(g, L, 'heap', outgoing=False))
+        else:
+            self._to.append(self._from[-1])  # same distances in both directions
+
+    def _select(self, g, k):
+        """Choose k landmarks by farthest-point selection, computing their tables."""
+        chosen = []
+        closest = {}  # distance from each vertex to its nearest chosen landmark
+        candidate = next(iter(g.vertices()), None)
+        while candidate is not None and len(chosen) < k:
+            chosen.append(candidate)
+            self._add(g, candidate)
+            for v, dist in self._from[-1].items():
+                if dist < closest.get(v, float('inf')):
+                    closest[v] = dist
+            candidate, best = None, 0
+            for v, dist in closest.items():
+                if dist > best:
+                    candidate, best = v, dist
+        return chosen
+
+    def landmarks(self):
+        """Return the list of landmark vertices."""
+        return self._landmarks
+
+    def heuristic(self, t):
+        """Return the ALT heuristic for paths to target vertex t."""
+        inf = float('inf')
+        # keep only the tables of landmarks related to t, as pairs (table, distance)
+        from_terms = [(table, table[t]) for table in self._from if t in table]
+        to_terms = [(table, table[t]) for table in self._to if t in table]
+
+        def heuristic(v):
+            best = 0
+            for table, dist in from_terms:  # d(L,t) - d(L,v) <= d(v,t)
+                bound = dist - table.get(v, inf)
+                if bound > best:
+                    best = bound
+            for table, dist in to_terms:  # d(v,L) - d(t,L) <= d(v,t)
+                bound = table.get(v, inf) - dist
+                if bound > best:
+                    best = bound
+            return best
+        return heuristic
+
+
+if __name__ == '__main__':
+    from .graph_examples import figure_14_15 as example
+
+    g = example()
+    verts = {v.element(): v for v in g.vertices()}
+    s, t = verts['SFO'], verts['BOS']
+    alt = Landmarks(g, 2)
+    for name, h in (('Dijkstra', lambda v: 0), ('ALT', alt.heuristic(t))):
+        dist, path, settled = a_star(g, s, t, h)
+        print(name, dist, [str(v) for v in path], "settled", settled)
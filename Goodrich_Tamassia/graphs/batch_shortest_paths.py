@@ -0,0 +1,89 @@
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
+from graphs import graph_io
+from graphs.shortest_paths import _heap_search, shortest_path_lengths
+
+
+def multi_source_lengths(g, sources):
+    """Compute distances from the nearest of several sources to reachable vertices of g.
+
+    This is a single run of Dijkstra's algorithm from a virtual super-source
+    joined to every vertex of sources by an edge of weight zero.
+
+    Return dictionary mapping each reachable vertex v to a (distance, source)
+    tuple, where source is the vertex of sources nearest to v.
+    """
+    cloud, parent = _heap_search(g, sources)
+    nearest = {}
+    for v, dist in cloud.items():  # in the order settled, so each parent comes first
+        u = parent[v]
+        nearest[v] = (dist, v if u is None else nearest[u][1])
+    return nearest
+
+
+def distance_matrix(g, sources, targets=None, processes=None, engine='heap'):
+    """Return the matrix of shortest-path distances from each source to each target.
+
+    Result is a list with one row per vertex of sources, each row a list of
+    distances to the vertices of targets (all vertices of g, in iteration
+    order, by default); unreachable targets have infinite distance.
+
+    If processes is given, the sources are divided among that many worker
+    processes. The graph is written once to a temporary file in graph_io
+    format, and each worker memory-maps it, so all workers share one
+    read-only copy rather than receiving a pickled graph.
+    """
+    verts = list(g.vertices())
+    index = {v: i for i, v in enumerate(verts)}
+    source_ids = [index[s] for s in sources]
+    target_ids = list(range(len(verts))) if targets is None else [index[t] for t in targets]
+    if processes is None:
+        return [_row(g, verts[s], [verts[t] for t in target_ids], engine) for s in source_ids]
+
+    fd, path = tempfile.mkstemp(suffix='.csrg')
+    os.close(fd)
+    try:
+        graph_io.save(g, path)
+        with ProcessPoolExecutor(processes, initializer=_load_worker_graph, initargs=(path,)) as pool:
+            chunk = max(1, len(source_ids) // (4 * processes))
+            return list(pool.map(_worker_row, source_ids, [target_ids] * len(source_ids),
+                                 [engine] * len(source_ids), chunksize=chunk))
+    finally:
+        os.remove(path)
+
+
+def _row(g, s, targets, engine):
+    """Return the list of distances from vertex s to each of the target vertices."""
+    d = shortest_path_lengths(g, s, engine)
+    inf = float('inf')
+    return [d.get(t, inf) for t in targets]
+
+
+# ------------------------- worker process state -------------------------
+_worker_graph = None  # CSRGraph memory-mapped by each worker process
+
+
+def _load_worker_graph(path):
+    """Initializer for worker processes: map the shared graph file."""
+    global _worker_graph
+    _worker_graph = graph_io.load(path)
+
+
+def _worker_row(s, target_ids, engine):
+    """Compute one row of the distance matrix in a worker process."""
+    verts = _worker_graph.vertices()
+    return _row(_worker_graph, verts[s], [verts[t] for t in target_ids], engine)
+
+
+if __name__ == '__main__':
+    from .graph_examples import figure_14_15 as example
+
+    g = example()
+    verts = {v.element(): v for v in g.vertices()}
+    depots = [verts['SFO'], verts['BOS']]
+    nearest = multi_source_lengths(g, depots)
+    print("Nearest depot:", {str(v): (d, str(s)) for v, (d, s) in nearest.items()})
+    for row in distance_matrix(g, depots, processes=2):
+        print(row)
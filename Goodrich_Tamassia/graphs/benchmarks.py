@@ -0,0 +1,138 @@
+"""Timing comparisons for the graph algorithms on generated graphs.
+
+Run as a module from the Goodrich_Tamassia directory, for example
+
+    python -m graphs.benchmarks dijkstra 100000 400000
+"""
+import random
+import sys
+from timeit import default_timer
+
+from graphs.graph import Graph
+
+
+def random_graph(n, m, directed=False, max_weight=100, seed=None):
+    """Return a Graph with n vertices and about m random edges.
+
+    Edge elements are integer weights in range [1, max_weight], or None if
+    max_weight is None. Vertex elements are the integers 0 to n-1.
+    """
+    rng = random.Random(seed)
+    g = Graph(directed)
+    verts = g.insert_vertices(range(n))
+    edges = []
+    for _ in range(m):
+        u, v = rng.randrange(n), rng.randrange(n)
+        if u != v:
+            x = None if max_weight is None else rng.randint(1, max_weight)
+            edges.append((u, v, x))
+    g.insert_edges(edges, verts, duplicates='keep_first')
+    return g
+
+
+def layered_network(layers, width, degree=3, max_capacity=100, seed=None):
+    """Return (g, s, t) for a directed layered network with random capacities.
+
+    The source s feeds every vertex of the first of layers layers of width
+    vertices each; every vertex has degree edges to random vertices of the
+    next layer; and every vertex of the last layer feeds the sink t.
+    """
+    rng = random.Random(seed)
+    g = Graph(directed=True)
+    verts = g.insert_vertices(range(layers * width + 2))
+    s, t = layers * width, layers * width + 1
+    edges = [(s, i, rng.randint(1, max_capacity)) for i in range(width)]
+    for layer in range(layers - 1):
+        for i in range(layer * width, (layer + 1) * width):
+            for _ in range(degree):
+                j = (layer + 1) * width + rng.randrange(width)
+                edges.append((i, j, rng.randint(1, max_capacity)))
+    edges.extend((i, t, rng.randint(1, max_capacity)) for i in range((layers - 1) * width, layers * width))
+    g.insert_edges(edges, verts, duplicates='keep_first')
+    return g, verts[s], verts[t]
+
+
+def grid_graph(rows, cols, max_weight=100, seed=None):
+    """Return an undirected Graph whose vertices form a rows by cols grid, as a road network might.
+
+    Each vertex is joined to its right and lower neighbors by edges with
+    integer weights in range [1, max_weight]. Vertex elements are the
+    integers 0 to rows*cols-1, row by row.
+    """
+    rng = random.Random(seed)
+    g = Graph()
+    verts = g.insert_vertices(range(rows * cols))
+    edges = []
+    for i in range(rows * cols):
+        if (i + 1) % cols:
+            edges.append((i, i + 1, rng.randint(1, max_weight)))
+        if i + cols < rows * cols:
+            edges.append((i, i + cols, rng.randint(1, max_weight)))
+    g.insert_edges(edges, verts)
+    return g
+
+
+def timed(func, *args, **kwargs):
+    """Return (seconds, result) for a single call of func."""
+    start = default_timer()
+    result = func(*args, **kwargs)
+    return default_timer() - start, result
+
+
+def dijkstra(n=20000, m=80000, seed=1):
+    """Compare the Dijkstra engines of shortest_path_lengths on a sparse graph."""
+    from graphs.csr_graph import CSRGraph
+    from graphs.shortest_paths import shortest_path_lengths
+
+    g = random_graph(n, m, seed=seed)
+    csr = CSRGraph.from_graph(g)
+    print('Dijkstra on {0} vertices, {1} edges'.format(g.vertex_count(), g.edge_count()))
+    for graph, name in ((g, 'Graph'), (csr, 'CSRGraph')):
+        src = next(iter(graph.vertices()))
+        for engine in ('adaptable', 'heap', 'radix'):
+            seconds, cloud = timed(shortest_path_lengths, graph, src, engine)
+            print('  {0:<9} {1:<10} {2:8.3f}s  {3} reached'.format(name, engine, seconds, len(cloud)))
+
+
+def max_flow(layers=50, width=200, degree=3, seed=1):
+    """Compare the max-flow methods on a generated layered network."""
+    from graphs.max_flow import max_flow as compute
+
+    g, s, t = layered_network(layers, width, degree, seed=seed)
+    print('Max flow on {0} vertices, {1} edges'.format(g.vertex_count(), g.edge_count()))
+    for method in ('dinic', 'push_relabel'):
+        seconds, (value, flow, cut) = timed(compute, g, s, t, method)
+        print('  {0:<13} {1:8.3f}s  value {2}, cut side {3}'.format(method, seconds, value, len(cut)))
+
+
+def sharded_bfs(n=100000, m=300000, k=4, seed=1):
+    """Compare BFS_complete with a ShardedGraph of k worker processes, on a random graph and a grid."""
+    from graphs.bfs import BFS_complete
+    from graphs.sharded_graph import ShardedGraph, partition_graph
+
+    side = int(n ** 0.5)
+    for name, g in (('random', random_graph(n, m, seed=seed)), ('grid', grid_graph(side, side, seed=seed))):
+        print('{0} graph, {1} vertices, {2} edges'.format(name, g.vertex_count(), g.edge_count()))
+        seconds, (labels, cut) = timed(partition_graph, g, k, seed=seed)
+        print('  partition  {0:8.3f}s  {1} cut edges ({2:.1%})'.format(seconds, len(cut), len(cut) / g.edge_count()))
+        single, forest = timed(BFS_complete, g)
+        print('  BFS_complete {0:6.3f}s'.format(single))
+        seconds, sharded = timed(ShardedGraph, g, k, labels)
+        with sharded:
+            print('  start {0} shards {1:6.3f}s'.format(k, seconds))
+            seconds, forest = timed(sharded.bfs_complete)
+            print('  sharded    {0:8.3f}s  {1} rounds, speedup {2:.2f}'.format(seconds, sharded.rounds(), single / seconds))
+
+
+BENCHMARKS = {
+    'dijkstra': dijkstra,
+    'max_flow': max_flow,
+    'sharded_bfs': sharded_bfs,
+}
+
+
+if __name__ == '__main__':
+    if len(sys.argv) < 2 or sys.argv[1] not in BENCHMARKS:
+        print('usage: python -m graphs.benchmarks {' + ','.join(BENCHMARKS) + '} [args...]')
+    else:
+        BENCHMARKS[sys.argv[1]](*(int(arg) for arg in sys.argv[2:]))
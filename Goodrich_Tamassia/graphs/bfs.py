@@ -19,6 +19,11 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+from array import array
+
+from graphs.csr_graph import as_csr
+
+
 def BFS(g, s, discovered):
     """Perform BFS of the undiscovered portion of Graph g starting at Vertex s.
 
@@ -50,3 +55,65 @@ def BFS_complete(g):
             forest[u] = None  # u will be a root of a tree
             BFS(g, u, forest)
     return forest
+
+
+def BFS_levels(g, s, alpha=14, beta=24):
+    """Perform a direction-optimizing, level-synchronous BFS of g from Vertex s.
+
+    Each level is expanded either top-down (scanning the edges leaving the
+    frontier) or bottom-up (letting every unvisited vertex look for a
+    parent in the frontier, kept as a bitmap). Bottom-up steps are chosen
+    while the frontier's edges exceed 1/alpha of the unvisited vertices'
+    edges, and abandoned once the frontier holds fewer than 1/beta of the
+    vertices; on low-diameter graphs this skips most edge checks in the
+    large middle levels.
+
+    Return (distance, parent) integer arrays indexed by the position of
+    each vertex in g.vertices(): distance counts edges from s, and parent
+    gives the position of the vertex's BFS parent; both are -1 for
+    unreachable vertices, and parent is -1 for s.
+    """
+    csr = as_csr(g)
+    n = csr.vertex_count()
+    offsets, targets = csr._offsets, csr._targets
+    in_offsets, in_targets = csr._in_offsets, csr._in_targets
+    root = s._index if csr is g else list(g.vertices()).index(s)
+    distance = array('l', [-1]) * n
+    parent = array('l', [-1]) * n
+    distance[root] = 0
+    frontier = [root]
+    unexplored_edges = len(targets) - (offsets[root + 1] - offsets[root])  # edges of unvisited vertices
+    bottom_up = False
+    level = 0
+    while frontier:
+        frontier_edges = sum(offsets[u + 1] - offsets[u] for u in frontier)
+        if not bottom_up and frontier_edges > unexplored_edges / alpha:
+            bottom_up = True
+        elif bottom_up and len(frontier) < n / beta:
+            bottom_up = False
+        level += 1
+        next_frontier = []
+        if bottom_up:
+            in_frontier = bytearray(n)
+            for u in frontier:
+                in_frontier[u] = 1
+            for v in range(n):
+                if distance[v] == -1:
+                    for k in range(in_offsets[v], in_offsets[v + 1]):
+                        u = in_targets[k]
+                        if in_frontier[u]:  # stop at the first parent found
+                            distance[v] = level
+                            parent[v] = u
+                            next_frontier.append(v)
+                            break
+        else:
+            for u in frontier:
+                for k in range(offsets[u], offsets[u + 1]):
+                    v = targets[k]
+                    if distance[v] == -1:
+                        distance[v] = level
+                        parent[v] = u
+                        next_frontier.append(v)
+        unexplored_edges -= sum(offsets[v + 1] - offsets[v] for v in next_frontier)
+        frontier = next_frontier
+    return distance, parent
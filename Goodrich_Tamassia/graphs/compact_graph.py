@@ -0,0 +1,179 @@
+from array import array
+
+from graphs.csr_graph import CSRGraph
+
+
+class CompactGraph:
+    """Representation of a simple graph with integer vertex ids and array adjacency lists.
+
+    Vertex i's neighbors and the ids of the connecting edges are kept in two
+    growable integer arrays, and the endpoints and elements of all edges
+    in parallel arrays indexed by edge id. No Edge objects are stored:
+    they are created on demand, as for CSRGraph, whose Vertex and Edge
+    classes are shared. Unlike CSRGraph, vertices and edges may be added
+    at any time.
+    """
+
+    Vertex = CSRGraph.Vertex
+    Edge = CSRGraph.Edge
+
+    def __init__(self, directed=False):
+        """Create an empty graph (undirected, by default).
+
+        Graph is directed if optional paramter is set to True.
+        """
+        self._directed = directed
+        self._vertices = []
+        self._out_targets = []  # _out_targets[i] is an array of the neighbors of vertex i
+        self._out_eids = []  # _out_eids[i] holds the edge id for each of those neighbors
+        # only create second lists for directed graph; use aliases for undirected
+        self._in_targets = [] if directed else self._out_targets
+        self._in_eids = [] if directed else self._out_eids
+        self._sources = array('i')  # origin of each edge
+        self._destinations = array('i')  # destination of each edge
+        self._elements = []  # element of each edge
+        self._csr = None  # CSRGraph snapshot for to_csr, discarded on any insertion
+
+    # ------------------------- nonpublic utilities -------------------------
+    def _validate_vertex(self, v):
+        """Verify that v is a Vertex of this graph."""
+        if not isinstance(v, self.Vertex):
+            raise TypeError('Vertex expected')
+        if v._container is not self:
+            raise ValueError('Vertex does not belong to this graph.')
+
+    def _find(self, i, j):
+        """Return the position of j among the neighbors of vertex i, or -1."""
+        try:
+            return self._out_targets[i].index(j)
+        except ValueError:
+            return -1
+
+    # ------------------------- public CompactGraph methods -------------------------
+    def is_directed(self):
+        """Return True if this is a directed graph; False if undirected."""
+        return self._directed
+
+    def vertex_count(self):
+        """Return the number of vertices in the graph."""
+        return len(self._vertices)
+
+    def vertices(self):
+        """Return an iteration of all vertices of the graph."""
+        return self._vertices
+
+    def vertex(self, i):
+        """Return the vertex with id i."""
+        return self._vertices[i]
+
+    def edge_count(self):
+        """Return the number of edges in the graph."""
+        return len(self._sources)
+
+    def edges(self):
+        """Return a set of all edges of the graph."""
+        verts = self._vertices
+        return {self.Edge(verts[self._sources[k]], verts[self._destinations[k]], self._elements[k], k)
+                for k in range(len(self._sources))}
+
+    def get_edge(self, u, v):
+        """Return the edge from u to v, or None if not adjacent."""
+        self._validate_vertex(u)
+        self._validate_vertex(v)
+        k = self._find(u._index, v._index)
+        if k < 0:
+            return None
+        eid = self._out_eids[u._index][k]
+        return self.Edge(u, v, self._elements[eid], eid)
+
+    def degree(self, v, outgoing=True):
+        """Return number of (outgoing) edges incident to vertex v in the graph.
+
+        If graph is directed, optional parameter used to count incoming edges.
+        """
+        self._validate_vertex(v)
+        adj = self._out_targets if outgoing else self._in_targets
+        return len(adj[v._index])
+
+    def incident_edges(self, v, outgoing=True):
+        """Return all (outgoing) edges incident to vertex v in the graph.
+
+        If graph is directed, optional parameter used to request incoming edges.
+        """
+        self._validate_vertex(v)
+        targets = (self._out_targets if outgoing else self._in_targets)[v._index]
+        eids = (self._out_eids if outgoing else self._in_eids)[v._index]
+        verts, elements, make = self._vertices, self._elements, self.Edge
+        if outgoing:
+            for j, eid in zip(targets, eids):
+                yield make(v, verts[j], elements[eid], eid)
+        else:
+            for j, eid in zip(targets, eids):
+                yield make(verts[j], v, elements[eid], eid)
+
+    def to_csr(self):
+        """Return a CSRGraph with the same vertices and edges, with matching indices and edge ids.
+
+        It is built straight from the edge arrays, without creating Edge
+        objects, and reused until the graph next changes.
+        """
+        if self._csr is None:
+            self._csr = CSRGraph._build(self._directed, [v.element() for v in self._vertices],
+                                        array('q', self._sources), array('q', self._destinations),
+                                        list(self._elements))
+        return self._csr
+
+    def insert_vertex(self, x=None):
+        """Insert and return a new Vertex with element x."""
+        self._csr = None
+        v = self.Vertex(self, x, len(self._vertices))
+        self._vertices.append(v)
+        self._out_targets.append(array('i'))
+        self._out_eids.append(array('i'))
+        if self._directed:
+            self._in_targets.append(array('i'))
+            self._in_eids.append(array('i'))
+        return v
+
+    def insert_vertices(self, elements):
+        """Insert a new Vertex for each element of the iterable, and return them as a list."""
+        return [self.insert_vertex(x) for x in elements]
+
+    def insert_edge(self, u, v, x=None):
+        """Insert and return a new Edge from u to v with auxiliary element x.
+
+        Raise a ValueError if u and v are not vertices of the graph.
+        Raise a ValueError if u and v are already adjacent.
+        """
+        if self.get_edge(u, v) is not None:  # includes error checking
+            raise ValueError('u and v are already adjacent')
+        self._csr = None
+        i, j = u._index, v._index
+        eid = len(self._sources)
+        self._sources.append(i)
+        self._destinations.append(j)
+        self._elements.append(x)
+        self._out_targets[i].append(j)
+        self._out_eids[i].append(eid)
+        if self._directed or i != j:  # an undirected self-loop is stored once
+            self._in_targets[j].append(i)
+            self._in_eids[j].append(eid)
+        return self.Edge(u, v, x, eid)
+
+
+if __name__ == '__main__':
+    import tracemalloc
+    from .benchmarks import random_graph
+    from .graph import Graph
+
+    source = random_graph(20000, 100000, seed=1)
+    for cls in (Graph, CompactGraph):
+        tracemalloc.start()
+        g = cls()
+        verts = g.insert_vertices(range(20000))
+        for e in source.edges():
+            a, b = e.endpoints()
+            g.insert_edge(verts[a.element()], verts[b.element()], e.element())
+        size = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        print(cls.__name__, "uses about", size // g.edge_count(), "bytes per edge")
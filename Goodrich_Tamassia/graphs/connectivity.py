@@ -0,0 +1,212 @@
+from collections import deque
+
+from graphs.csr_graph import as_csr
+from graphs.graph import Graph
+from graphs.partition import UnionFind
+from graphs.scc import _tarjan
+
+
+class ConnectivityIndex:
+    """Connected components of a graph, labeled once for constant-time queries.
+
+    Edge direction is ignored, so for a directed graph the components are
+    the weakly connected ones; use ReachabilityLabels for directed paths.
+    """
+
+    def __init__(self, g):
+        """Label the connected components of graph g."""
+        self._index = {v: i for i, v in enumerate(g.vertices())}
+        groups = UnionFind(len(self._index))
+        for e in g.edges():
+            u, v = e.endpoints()
+            groups.union(self._index[u], self._index[v])
+        self._label = groups.labels()
+        self._sizes = [0] * groups.group_count()
+        for c in self._label:
+            self._sizes[c] += 1
+
+    def component(self, v):
+        """Return the number (from 0 to component_count()-1) of the component containing v."""
+        return self._label[self._index[v]]
+
+    def connected(self, u, v):
+        """Return True if u and v are in the same component."""
+        return self._label[self._index[u]] == self._label[self._index[v]]
+
+    def component_size(self, v):
+        """Return the number of vertices in the component containing v."""
+        return self._sizes[self._label[self._index[v]]]
+
+    def component_count(self):
+        """Return the number of components."""
+        return len(self._sizes)
+
+
+class ReachabilityLabels:
+    """Reachability in a directed graph, answered from precomputed 2-hop labels.
+
+    Strongly connected components are collapsed first. Each component c of
+    the resulting DAG then gets two sets of hub components: out[c], hubs
+    that c reaches, and in[c], hubs that reach c. They are built so that c
+    reaches d exactly when out[c] and in[d] share a hub, by pruned
+    landmark labeling: hubs are taken in decreasing order of degree, and
+    each is added to the labels of the components it reaches (or that
+    reach it) by a breadth-first search that stops wherever the labels
+    already in place answer the query. A query is then a set
+    intersection, with no traversal of the graph.
+    """
+
+    def __init__(self, g):
+        """Build the labels for graph g."""
+        csr = as_csr(g)
+        n = csr.vertex_count()
+        offsets, targets = csr._offsets, csr._targets
+        self._index = {v: i for i, v in enumerate(g.vertices())}
+        count, self._label = _tarjan(n, offsets, targets)
+        successors = [set() for _ in range(count)]
+        predecessors = [set() for _ in range(count)]
+        for i in range(n):
+            a = self._label[i]
+            for k in range(offsets[i], offsets[i + 1]):
+                b = self._label[targets[k]]
+                if a != b:
+                    successors[a].add(b)
+                    predecessors[b].add(a)
+        out = self._out = [set() for _ in range(count)]
+        into = self._in = [set() for _ in range(count)]
+        hubs = sorted(range(count), key=lambda c: -(len(successors[c]) + 1) * (len(predecessors[c]) + 1))
+        for rank, hub in enumerate(hubs):
+            for c in _pruned_search(hub, successors, lambda c: not out[hub].isdisjoint(into[c])):
+                into[c].add(rank)
+            for c in _pruned_search(hub, predecessors, lambda c: not out[c].isdisjoint(into[hub])):
+                out[c].add(rank)
+
+    def component(self, v):
+        """Return the strongly connected component of v, numbered in reverse topological order."""
+        return self._label[self._index[v]]
+
+    def component_count(self):
+        """Return the number of strongly connected components."""
+        return len(self._out)
+
+    def label_count(self):
+        """Return the total number of hub entries stored in all labels."""
+        return sum(map(len, self._out)) + sum(map(len, self._in))
+
+    def reachable(self, u, v):
+        """Return True if there is a directed path from u to v (every vertex reaches itself)."""
+        a, b = self._label[self._index[u]], self._label[self._index[v]]
+        if a == b:
+            return True
+        if a < b:  # components only reach lower-numbered components
+            return False
+        return not self._out[a].isdisjoint(self._in[b])
+
+
+class DynamicConnectivity:
+    """Connected components of a graph, kept current as vertices and edges are inserted.
+
+    Insertions go through this structure, which performs them on the
+    underlying graph and merges components in a UnionFind, in nearly
+    constant amortized time. A union-find structure cannot split a group,
+    so removed edges are only recorded; the components are rebuilt from
+    the graph once, on the first query after a batch of removals.
+    Edge direction is ignored, as for ConnectivityIndex.
+    """
+
+    def __init__(self, g=None):
+        """Maintain the components of Graph g (a new empty undirected graph by default)."""
+        self._graph = Graph() if g is None else g
+        self.rebuild()
+
+    def rebuild(self):
+        """Recompute the components from the underlying graph."""
+        self._index = {v: i for i, v in enumerate(self._graph.vertices())}
+        self._groups = UnionFind(len(self._index))
+        for e in self._graph.edges():
+            u, v = e.endpoints()
+            self._groups.union(self._index[u], self._index[v])
+        self._stale = False  # True if edges were removed since the last rebuild
+
+    def _current(self):
+        """Return the UnionFind, first rebuilding it if edges have been removed."""
+        if self._stale:
+            self.rebuild()
+        return self._groups
+
+    def graph(self):
+        """Return the underlying graph."""
+        return self._graph
+
+    def insert_vertex(self, x=None):
+        """Insert and return a new Vertex with element x, in a component of its own."""
+        v = self._graph.insert_vertex(x)
+        self._index[v] = self._groups.make_set()
+        return v
+
+    def insert_edge(self, u, v, x=None):
+        """Insert and return a new Edge from u to v with auxiliary element x, merging their components.
+
+        Raise a ValueError if u and v are already adjacent.
+        """
+        e = self._graph.insert_edge(u, v, x)
+        if not self._stale:  # otherwise the coming rebuild includes e
+            self._groups.union(self._index[u], self._index[v])
+        return e
+
+    def remove_edge(self, e):
+        """Remove Edge e from the graph; components are rebuilt when next queried."""
+        self._graph.remove_edge(e)
+        self._stale = True
+
+    def connected(self, u, v):
+        """Return True if u and v are in the same component."""
+        return self._current().connected(self._index[u], self._index[v])
+
+    def component_size(self, v):
+        """Return the number of vertices in the component containing v."""
+        return self._current().group_size(self._index[v])
+
+    def component_count(self):
+        """Return the number of components."""
+        return self._current().group_count()
+
+
+def _pruned_search(start, adjacent, answered):
+    """Return the components found by breadth-first search from start along adjacent.
+
+    The search does not include or continue past any other component c
+    for which answered(c) is True.
+    """
+    found = [start]
+    seen = {start}
+    queue = deque([start])
+    while queue:
+        c = queue.popleft()
+        for d in adjacent[c]:
+            if d not in seen:
+                seen.add(d)
+                if not answered(d):
+                    found.append(d)
+                    queue.append(d)
+    return found
+
+
+if __name__ == '__main__':
+    from .graph_examples import figure_14_11 as directed_example, figure_14_15 as undirected_example
+
+    g = undirected_example()
+    components = ConnectivityIndex(g)
+    print("Components:", components.component_count())
+    g = directed_example()
+    reach = ReachabilityLabels(g)
+    verts = {v.element(): v for v in g.vertices()}
+    print("SCCs:", reach.component_count(), "labels:", reach.label_count())
+    for a, b in (('BOS', 'LAX'), ('LAX', 'BOS'), ('JFK', 'MIA')):
+        print(a, "reaches", b, reach.reachable(verts[a], verts[b]))
+    dynamic = DynamicConnectivity()
+    a, b, c = (dynamic.insert_vertex(x) for x in 'ABC')
+    ab = dynamic.insert_edge(a, b)
+    print("Components after (A,B):", dynamic.component_count())
+    dynamic.remove_edge(ab)
+    print("Components after removing it:", dynamic.component_count())
@@ -0,0 +1,211 @@
+from array import array
+from heapq import heapify, heappop, heappush
+
+from graphs import graph_io
+from graphs.csr_graph import CSRGraph, as_csr
+
+
+class ContractionHierarchy:
+    """Contraction hierarchy answering repeated shortest-path distance queries on a static graph.
+
+    Preprocessing contracts the vertices one at a time in order of
+    importance, adding a shortcut edge (u,w) whenever contracting v would
+    otherwise lose the only shortest path u-v-w. A query then needs only a
+    bidirectional search that moves exclusively toward more important
+    vertices, which settles a tiny fraction of the graph.
+
+    The hierarchy is kept as a CSRGraph over the vertex indices of the
+    original graph, whose vertex elements are the contraction ranks and
+    whose edges are the original edges plus the shortcuts.
+    """
+
+    def __init__(self, g, hierarchy):
+        """Do not call constructor directly. Use build or load."""
+        self._index = {v: i for i, v in enumerate(g.vertices())}
+        self._hierarchy = hierarchy
+        self._rank = [v.element() for v in hierarchy.vertices()]
+
+    @classmethod
+    def build(cls, g, witness_limit=500):
+        """Preprocess weighted graph g and return its ContractionHierarchy.
+
+        Edge elements of g must be nonnegative weights. witness_limit bounds
+        the number of vertices settled by each witness search; a smaller
+        limit speeds up preprocessing at the cost of extra shortcuts.
+        """
+        csr = as_csr(g)
+        n = csr.vertex_count()
+        directed = csr.is_directed()
+        # remaining graph as maps from neighbor index to weight
+        out = [{} for _ in range(n)]
+        inn = [{} for _ in range(n)] if directed else out
+        for u in range(n):
+            for k in range(csr._offsets[u], csr._offsets[u + 1]):
+                w = csr._targets[k]
+                if w != u:
+                    out[u][w] = csr._element(csr._eids[k])
+                    if directed:
+                        inn[w][u] = out[u][w]
+        contraction = _Contraction(out, inn, directed, witness_limit)
+        rank, sources, targets, weights = contraction.run()
+        hierarchy = CSRGraph._build(directed, rank, sources, targets, weights)
+        return cls(g, hierarchy)
+
+    @classmethod
+    def load(cls, path, g):
+        """Return the hierarchy previously saved to path for graph g.
+
+        g must have the same vertices, in the same iteration order, as the
+        graph from which the hierarchy was built.
+        """
+        hierarchy = graph_io.load(path)
+        if hierarchy.vertex_count() != g.vertex_count() or hierarchy.is_directed() != g.is_directed():
+            raise ValueError('hierarchy was built for a different graph')
+        return cls(g, hierarchy)
+
+    def save(self, path):
+        """Write the hierarchy to the file at path."""
+        graph_io.save(self._hierarchy, path)
+
+    def edge_count(self):
+        """Return the number of edges in the hierarchy, including shortcuts."""
+        return self._hierarchy.edge_count()
+
+    def distance(self, s, t):
+        """Return the shortest-path distance from vertex s to vertex t (infinite if unreachable)."""
+        i, j = self._index[s], self._index[t]
+        if i == j:
+            return 0
+        h, rank = self._hierarchy, self._rank
+        # index 0 holds the forward search from s, index 1 the backward search from t
+        rows = ((h._offsets, h._targets, h._eids), (h._in_offsets, h._in_targets, h._in_eids))
+        d = ({i: 0}, {j: 0})
+        pq = ([(0, i)], [(0, j)])
+        best = float('inf')
+        while True:
+            side = 0 if pq[0] and (not pq[1] or pq[0][0][0] <= pq[1][0][0]) else 1
+            if not pq[side] or pq[side][0][0] >= best:
+                break  # neither search can improve on best
+            key, u = heappop(pq[side])
+            if key > d[side][u]:
+                continue  # stale entry
+            if u in d[1 - side]:
+                best = min(best, key + d[1 - side][u])
+            offsets, targets, eids = rows[side]
+            for k in range(offsets[u], offsets[u + 1]):
+                w = targets[k]
+                if rank[w] > rank[u]:  # only move up the hierarchy
+                    dist = key + h._element(eids[k])
+                    if w not in d[side] or dist < d[side][w]:
+                        d[side][w] = dist
+                        heappush(pq[side], (dist, w))
+        return best
+
+
+class _Contraction:
+    """Nonpublic state of the vertex contraction performed by ContractionHierarchy.build."""
+
+    def __init__(self, out, inn, directed, witness_limit):
+        self._out = out  # _out[u][w] is the weight of remaining edge u->w
+        self._in = inn  # _in[w][u] is the same weight (alias of _out if undirected)
+        self._directed = directed
+        self._limit = witness_limit
+        self._contracted_neighbors = [0] * len(out)
+
+    def run(self):
+        """Contract every vertex; return ranks and the (sources, targets, weights) of the hierarchy."""
+        n = len(self._out)
+        rank = [-1] * n
+        sources, targets, weights = array('q'), array('q'), []
+        pq = [(self._priority(v), v) for v in range(n)]
+        heapify(pq)
+        order = 0
+        while pq:
+            _, v = heappop(pq)
+            priority = self._priority(v)  # lazy update of the stored priority
+            if pq and priority > pq[0][0]:
+                heappush(pq, (priority, v))
+                continue
+            shortcuts = self._shortcuts(v)
+            rank[v] = order
+            order += 1
+            # every remaining edge at v leads to a vertex contracted later
+            for w, wgt in self._out[v].items():
+                sources.append(v)
+                targets.append(w)
+                weights.append(wgt)
+                del self._in[w][v]
+                self._contracted_neighbors[w] += 1
+            if self._directed:
+                for u, wgt in self._in[v].items():
+                    sources.append(u)
+                    targets.append(v)
+                    weights.append(wgt)
+                    del self._out[u][v]
+                    self._contracted_neighbors[u] += 1
+            self._out[v] = self._in[v] = {}
+            for u, w, wgt in shortcuts:
+                self._add_edge(u, w, wgt)
+        return rank, sources, targets, weights
+
+    def _add_edge(self, u, w, wgt):
+        """Add edge u->w to the remaining graph, keeping the smaller weight if present."""
+        if wgt < self._out[u].get(w, float('inf')):
+            self._out[u][w] = wgt
+            self._in[w][u] = wgt
+
+    def _priority(self, v):
+        """Return the contraction priority of v (lower is contracted earlier)."""
+        removed = len(self._out[v]) + (len(self._in[v]) if self._directed else 0)
+        return len(self._shortcuts(v)) - removed + self._contracted_neighbors[v]
+
+    def _shortcuts(self, v):
+        """Return the (u, w, weight) shortcuts needed if v were contracted now."""
+        result = []
+        outgoing = self._out[v]
+        if not outgoing:
+            return result
+        longest = max(outgoing.values())
+        for u, wgt_in in self._in[v].items():
+            dist = self._witness_search(u, v, wgt_in + longest)
+            for w, wgt_out in outgoing.items():
+                if w == u or (not self._directed and w < u):
+                    continue  # undirected pairs are considered once
+                via = wgt_in + wgt_out
+                if dist.get(w, float('inf')) > via:
+                    result.append((u, w, via))
+        return result
+
+    def _witness_search(self, u, v, limit):
+        """Return distances from u avoiding v, for vertices within distance limit.
+
+        The search gives up after settling witness_limit vertices, so a
+        missing entry may mean only that no witness was found.
+        """
+        d = {u: 0}
+        pq = [(0, u)]
+        settled = 0
+        while pq and settled < self._limit:
+            key, x = heappop(pq)
+            if key > d[x]:
+                continue
+            if key > limit:
+                break
+            settled += 1
+            for y, wgt in self._out[x].items():
+                if y != v:
+                    dist = key + wgt
+                    if dist < d.get(y, float('inf')):
+                        d[y] = dist
+                        heappush(pq, (dist, y))
+        return d
+
+
+if __name__ == '__main__':
+    from .graph_examples import figure_14_15 as example
+
+    g = example()
+    ch = ContractionHierarchy.build(g)
+    verts = {v.element(): v for v in g.vertices()}
+    print("Hierarchy has", ch.edge_count(), "edges including shortcuts")
+    print("SFO to BOS is", ch.distance(verts['SFO'], verts['BOS']))
@@ -0,0 +1,354 @@
+from array import array
+from bisect import bisect_left
+
+
+class CSRGraph:
+    """Frozen representation of a simple graph using compressed sparse rows.
+
+    Adjacency is kept in flat integer arrays rather than per-vertex maps:
+    the neighbors of the vertex with index i are targets[offsets[i]:offsets[i+1]],
+    sorted by index, and eids holds the id of the edge stored in each slot.
+    Edge elements are kept in one side table indexed by edge id (a compact
+    numeric array when every element is a number).
+
+    The public interface mirrors that of Graph, so traversal algorithms
+    written against Graph run unchanged on a CSRGraph.
+    """
+
+    # ------------------------- nested Vertex class -------------------------
+    class Vertex:
+        """Lightweight vertex structure for a CSR graph."""
+        __slots__ = '_container', '_element', '_index'
+
+        def __init__(self, container, x, i):
+            """Do not call constructor directly. Vertices are created with the graph."""
+            self._container = container
+            self._element = x
+            self._index = i
+
+        def element(self):
+            """Return element associated with this vertex."""
+            return self._element
+
+        def index(self):
+            """Return the index of this vertex within its graph."""
+            return self._index
+
+        def __hash__(self):  # will allow vertex to be a map/set key
+            return self._index
+
+        def __str__(self):
+            return str(self._element)
+
+    # ------------------------- nested Edge class -------------------------
+    class Edge:
+        """Lightweight edge structure for a CSR graph.
+
+        Edge instances are created on demand; two instances describing the
+        same stored edge of the same graph compare equal.
+        """
+        __slots__ = '_origin', '_destination', '_element', '_index'
+
+        def __init__(self, u, v, x, eid):
+            """Do not call constructor directly. Use the graph's incident_edges or get_edge."""
+            self._origin = u
+            self._destination = v
+            self._element = x
+            self._index = eid
+
+        def endpoints(self):
+            """Return (u,v) tuple for vertices u and v."""
+            return self._origin, self._destination
+
+        def opposite(self, v):
+            """Return the vertex that is opposite v on this edge."""
+            if not isinstance(v, CSRGraph.Vertex):
+                raise TypeError('v must be a Vertex')
+            if v is self._origin:
+                return self._destination
+            elif v is self._destination:
+                return self._origin
+            raise ValueError('v not incident to edge')
+
+        def element(self):
+            """Return element associated with this edge."""
+            return self._element
+
+        def index(self):
+            """Return the id of this edge within its graph."""
+            return self._index
+
+        def __eq__(self, other):
+            return (type(other) is type(self) and other._index == self._index
+                    and other._origin._container is self._origin._container)
+
+        def __hash__(self):  # will allow edge to be a map/set key
+            return self._index
+
+        def __str__(self):
+            return '({0},{1},{2})'.format(self._origin, self._destination, self._element)
+
+    # ------------------------- construction -------------------------
+    def __init__(self, directed, vertex_elements, offsets, targets, eids, elements,
+                 in_offsets=None, in_targets=None, in_eids=None):
+        """Do not call constructor directly. Use from_graph or from_edgelist."""
+        self._directed = directed
+        self._vertices = [self.Vertex(self, x, i) for i, x in enumerate(vertex_elements)]
+        self._offsets = offsets
+        self._targets = targets
+        self._eids = eids
+        self._elements = elements  # indexed by edge id; None if no edge has an element
+        if directed:
+            self._in_offsets = in_offsets
+            self._in_targets = in_targets
+            self._in_eids = in_eids
+        else:  # use aliases for undirected graph
+            self._in_offsets = offsets
+            self._in_targets = targets
+            self._in_eids = eids
+
+    @classmethod
+    def from_graph(cls, g):
+        """Return a CSRGraph with the same vertices and edges as Graph g.
+
+        Vertex indices follow the iteration order of g.vertices().
+        """
+        index = {}
+        elements = []
+        for i, v in enumerate(g.vertices()):
+            index[v] = i
+            elements.append(v.element())
+        sources, destinations, edge_elements = array('q'), array('q'), []
+        for e in g.edges():
+            u, v = e.endpoints()
+            sources.append(index[u])
+            destinations.append(index[v])
+            edge_elements.append(e.element())
+        return cls._build(g.is_directed(), elements, sources, destinations, edge_elements)
+
+    @classmethod
+    def from_edgelist(cls, E, directed=False):
+        """Make a CSRGraph based on a sequence of edge tuples.
+
+        Edges can be either of form (origin,destination) or
+        (origin,destination,element), as for graph_from_edgelist. Vertex set
+        is presumed to be those incident to at least one edge; vertices are
+        indexed in order of first appearance.
+        """
+        index = {}  # map from vertex label to its index
+        sources, destinations, edge_elements = array('q'), array('q'), []
+        for e in E:
+            for label in (e[0], e[1]):
+                if label not in index:
+                    index[label] = len(index)
+            sources.append(index[e[0]])
+            destinations.append(index[e[1]])
+            edge_elements.append(e[2] if len(e) > 2 else None)
+        return cls._build(directed, list(index), sources, destinations, edge_elements)
+
+    @classmethod
+    def _build(cls, directed, vertex_elements, sources, destinations, edge_elements):
+        """Build the graph from parallel edge arrays, where edge i joins sources[i] to destinations[i]."""
+        n = len(vertex_elements)
+        if directed:
+            offsets, targets, eids = _compress(n, sources, destinations, range(len(sources)))
+            in_offsets, in_targets, in_eids = _compress(n, destinations, sources, range(len(sources)))
+        else:
+            # store every edge once per endpoint, but a self-loop only once
+            loops = [i for i in range(len(sources)) if sources[i] == destinations[i]]
+            if loops:
+                keep = [i for i in range(len(sources)) if sources[i] != destinations[i]]
+                rows = sources + array('q', (destinations[i] for i in keep))
+                cols = destinations + array('q', (sources[i] for i in keep))
+                ids = list(range(len(sources))) + keep
+            else:
+                rows = sources + destinations
+                cols = destinations + sources
+                ids = list(range(len(sources))) * 2
+            offsets, targets, eids = _compress(n, rows, cols, ids)
+            in_offsets = in_targets = in_eids = None
+        return cls(directed, vertex_elements, offsets, targets, eids, _pack(edge_elements),
+                   in_offsets, in_targets, in_eids)
+
+    # ------------------------- nonpublic utilities -------------------------
+    def _validate_vertex(self, v):
+        """Verify that v is a Vertex of this graph."""
+        if not isinstance(v, self.Vertex):
+            raise TypeError('Vertex expected')
+        if v._container is not self:
+            raise ValueError('Vertex does not belong to this graph.')
+
+    def _element(self, eid):
+        """Return the element of the edge with the given id."""
+        return None if self._elements is None else self._elements[eid]
+
+    def _row(self, v, outgoing=True):
+        """Return (targets, eids, start, stop) describing the slots of vertex v."""
+        if outgoing:
+            return self._targets, self._eids, self._offsets[v._index], self._offsets[v._index + 1]
+        return self._in_targets, self._in_eids, self._in_offsets[v._index], self._in_offsets[v._index + 1]
+
+    # ------------------------- public CSRGraph methods -------------------------
+    def is_directed(self):
+        """Return True if this is a directed graph; False if undirected."""
+        return self._directed
+
+    def vertex_count(self):
+        """Return the number of vertices in the graph."""
+        return len(self._vertices)
+
+    def vertices(self):
+        """Return an iteration of all vertices of the graph."""
+        return self._vertices
+
+    def vertex(self, i):
+        """Return the vertex with index i."""
+        return self._vertices[i]
+
+    def edge_count(self):
+        """Return the number of edges in the graph."""
+        total = len(self._targets)
+        if self._directed:
+            return total
+        loops = sum(1 for i in range(len(self._vertices)) if self._has_target(i, i))
+        return (total + loops) // 2  # self-loops are stored only once
+
+    def _has_target(self, i, j):
+        """Return True if the row of vertex index i contains index j."""
+        start, stop = self._offsets[i], self._offsets[i + 1]
+        k = bisect_left(self._targets, j, start, stop)
+        return k < stop and self._targets[k] == j
+
+    def edges(self):
+        """Return a set of all edges of the graph."""
+        result = set()
+        verts = self._vertices
+        for u in verts:
+            i = u._index
+            for k in range(self._offsets[i], self._offsets[i + 1]):
+                j = self._targets[k]
+                if self._directed or i <= j:  # report undirected edges once
+                    eid = self._eids[k]
+                    result.add(self.Edge(u, verts[j], self._element(eid), eid))
+        return result
+
+    def get_edge(self, u, v):
+        """Return the edge from u to v, or None if not adjacent."""
+        self._validate_vertex(u)
+        self._validate_vertex(v)
+        start, stop = self._offsets[u._index], self._offsets[u._index + 1]
+        k = bisect_left(self._targets, v._index, start, stop)
+        if k < stop and self._targets[k] == v._index:
+            eid = self._eids[k]
+            return self.Edge(u, v, self._element(eid), eid)
+        return None
+
+    def degree(self, v, outgoing=True):
+        """Return number of (outgoing) edges incident to vertex v in the graph.
+
+        If graph is directed, optional parameter used to count incoming edges.
+        """
+        self._validate_vertex(v)
+        offsets = self._offsets if outgoing else self._in_offsets
+        return offsets[v._index + 1] - offsets[v._index]
+
+    def incident_edges(self, v, outgoing=True):
+        """Return all (outgoing) edges incident to vertex v in the graph.
+
+        If graph is directed, optional parameter used to request incoming edges.
+        """
+        self._validate_vertex(v)
+        targets, eids, start, stop = self._row(v, outgoing)
+        verts = self._vertices
+        for k in range(start, stop):
+            eid = eids[k]
+            w = verts[targets[k]]
+            if outgoing:
+                yield self.Edge(v, w, self._element(eid), eid)
+            else:
+                yield self.Edge(w, v, self._element(eid), eid)
+
+
+# ------------------------- module-level utilities -------------------------
+def _compress(n, rows, cols, ids):
+    """Return (offsets, targets, eids) grouping cols by rows, with each row sorted.
+
+    Uses two stable counting-sort passes (by column, then by row) so the
+    construction is linear in the number of slots. Raise a ValueError if
+    the same (row, col) pair occurs twice.
+    """
+    m = len(rows)
+    by_col = _counting_order(n, cols, range(m))
+    order = _counting_order(n, rows, by_col)
+    offsets = array('q', [0]) * (n + 1)
+    for r in rows:
+        offsets[r + 1] += 1
+    for i in range(n):
+        offsets[i + 1] += offsets[i]
+    targets = array('q', (cols[k] for k in order))
+    eids = array('q', (ids[k] for k in order))
+    for i in range(n):
+        for k in range(offsets[i] + 1, offsets[i + 1]):
+            if targets[k] == targets[k - 1]:
+                raise ValueError('u and v are already adjacent')
+    return offsets, targets, eids
+
+
+def _counting_order(n, keys, order):
+    """Return the positions in order stably sorted by keys[position] (0 <= key < n)."""
+    start = [0] * (n + 1)
+    for k in keys:
+        start[k + 1] += 1
+    for i in range(n):
+        start[i + 1] += start[i]
+    result = [0] * len(keys)
+    for pos in order:
+        k = keys[pos]
+        result[start[k]] = pos
+        start[k] += 1
+    return result
+
+
+def _pack(elements):
+    """Store a list of edge elements compactly.
+
+    Return None if all elements are None, an integer array if all are
+    machine-sized ints, a floating-point array if all are floats or ints
+    that a float represents exactly, or else the list itself.
+    """
+    if all(x is None for x in elements):
+        return None
+    if all(isinstance(x, int) and not isinstance(x, bool) for x in elements):
+        try:
+            return array('q', elements)
+        except OverflowError:  # too large for a machine integer
+            return elements
+    if all(type(x) is float or (isinstance(x, int) and not isinstance(x, bool) and abs(x) <= 2 ** 53)
+           for x in elements):
+        return array('d', elements)
+    return elements
+
+
+def as_csr(g):
+    """Return g itself if it is a CSRGraph, or else a CSRGraph built from it.
+
+    A graph with its own to_csr method, such as CompactGraph, provides the
+    CSRGraph itself; any other graph is converted edge by edge.
+    """
+    if isinstance(g, CSRGraph):
+        return g
+    if hasattr(g, 'to_csr'):
+        return g.to_csr()
+    return CSRGraph.from_graph(g)
+
+
+if __name__ == '__main__':
+    from .graph_examples import figure_14_15 as example
+    from .shortest_paths import shortest_path_lengths
+
+    g = CSRGraph.from_graph(example())
+    print("Number of vertices is", g.vertex_count())
+    print("Number of edges is", g.edge_count())
+    src = g.vertex(0)
+    d = shortest_path_lengths(g, src)
+    print("Distances from", src, {str(v): d[v] for v in d})
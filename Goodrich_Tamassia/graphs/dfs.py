@@ -19,18 +19,101 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+# kinds of events reported by DFS_events
+PRE = 'pre'  # a vertex is discovered
+POST = 'post'  # all edges leaving a vertex have been explored
+TREE_EDGE = 'tree'  # an edge that discovers a new vertex
+BACK_EDGE = 'back'  # an edge leading to an ancestor in the DFS tree
+FORWARD_EDGE = 'forward'  # an edge leading to a finished descendant (directed graphs only)
+CROSS_EDGE = 'cross'  # any other edge (directed graphs only)
+
+
 def DFS(g, u, discovered):
     """Perform DFS of the undiscovered portion of Graph g starting at Vertex u.
 
     discovered is a dictionary mapping each vertex to the edge that was used to
     discover it during the DFS. (u should be "discovered" prior to the call.)
     Newly discovered vertices will be added to the dictionary as a result.
+
+    Vertices are visited in the same order as by the recursive formulation,
+    but an explicit stack is used, so arbitrarily long paths are supported.
+    """
+    stack = [(u, iter(g.incident_edges(u)))]  # vertices being explored, with remaining edges
+    while stack:
+        w, edges = stack[-1]
+        for e in edges:  # for every outgoing edge from w
+            v = e.opposite(w)
+            if v not in discovered:  # v is an unvisited vertex
+                discovered[v] = e  # e is the tree edge that discovered v
+                stack.append((v, iter(g.incident_edges(v))))  # continue exploring from v
+                break
+        else:
+            stack.pop()  # all edges from w are explored
+
+
+def DFS_events(g, u, discovered):
+    """Generate the events of a DFS of the undiscovered portion of Graph g starting at Vertex u.
+
+    discovered follows the same contract as for DFS. Each event is a
+    (kind, v, e) tuple, where kind is one of the constants defined above:
+    for PRE and POST, v is the vertex and e the edge that discovered it
+    (None for u); for edge events, e is the edge and v is the endpoint from
+    which it is explored. Each non-tree edge of an undirected graph is
+    reported once, as a BACK_EDGE.
+    """
+    directed = g.is_directed()
+    order = {u: 0}  # discovery order of vertices found by this call
+    active = {u}  # vertices whose exploration is not finished
+    yield PRE, u, discovered[u]
+    stack = [(u, iter(g.incident_edges(u)))]
+    while stack:
+        w, edges = stack[-1]
+        for e in edges:
+            v = e.opposite(w)
+            if v not in discovered:
+                discovered[v] = e
+                order[v] = len(order)
+                active.add(v)
+                yield TREE_EDGE, w, e
+                yield PRE, v, e
+                stack.append((v, iter(g.incident_edges(v))))
+                break
+            if v in active:
+                if directed or e != discovered[w]:  # skip the tree edge back to the parent
+                    yield BACK_EDGE, w, e
+            elif directed:
+                if v in order and order[v] > order[w]:
+                    yield FORWARD_EDGE, w, e
+                else:
+                    yield CROSS_EDGE, w, e
+        else:
+            stack.pop()
+            active.discard(w)
+            yield POST, w, discovered[w]
+
+
+def DFS_events_complete(g):
+    """Generate the events of a DFS of the entire graph g, as for DFS_events.
+
+    Each root of the DFS forest is reported by a PRE event whose edge is None.
+    """
+    forest = {}
+    for u in g.vertices():
+        if u not in forest:
+            forest[u] = None  # u will be the root of a tree
+            yield from DFS_events(g, u, forest)
+
+
+def has_cycle(g):
+    """Return True if graph g contains a cycle.
+
+    For a directed graph this means a directed cycle; for an undirected
+    graph, any cycle. Exploration stops at the first back edge.
     """
-    for e in g.incident_edges(u):  # for every outgoing edge from u
-        v = e.opposite(u)
-        if v not in discovered:  # v is an unvisited vertex
-            discovered[v] = e  # e is the tree edge that discovered v
-            DFS(g, v, discovered)  # recursively explore from v
+    for kind, _, _ in DFS_events_complete(g):
+        if kind == BACK_EDGE:
+            return True
+    return False
 
 
 def construct_path(u, v, discovered):
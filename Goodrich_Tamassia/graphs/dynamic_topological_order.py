@@ -0,0 +1,108 @@
+from graphs.graph import Graph
+from graphs.topological_sort import topological_sort
+
+
+class DynamicTopologicalOrder:
+    """Topological order of a directed acyclic graph, maintained as edges are inserted.
+
+    Uses the algorithm of Pearce and Kelly: an edge (u,v) that agrees with
+    the current order costs nothing, and otherwise only the vertices whose
+    positions lie between those of v and u, and that are reachable from v
+    or reach u, are searched and reshuffled among their own positions.
+    """
+
+    def __init__(self, g=None):
+        """Maintain the order of directed acyclic Graph g (a new empty graph by default).
+
+        Raise a ValueError if g is undirected or has a cycle.
+        """
+        if g is None:
+            g = Graph(directed=True)
+        if not g.is_directed():
+            raise ValueError('graph must be directed')
+        self._graph = g
+        self._at = topological_sort(g)  # vertex at each position of the order
+        if len(self._at) != g.vertex_count():
+            raise ValueError('graph has a cycle')
+        self._position = {v: i for i, v in enumerate(self._at)}
+
+    def __len__(self):
+        """Return the number of vertices in the order."""
+        return len(self._at)
+
+    def __iter__(self):
+        """Generate the vertices of the graph in topological order."""
+        return iter(self._at)
+
+    def graph(self):
+        """Return the underlying graph."""
+        return self._graph
+
+    def position(self, v):
+        """Return the position of vertex v in the current order."""
+        return self._position[v]
+
+    def insert_vertex(self, x=None):
+        """Insert and return a new Vertex with element x, placed last in the order."""
+        v = self._graph.insert_vertex(x)
+        self._position[v] = len(self._at)
+        self._at.append(v)
+        return v
+
+    def insert_edge(self, u, v, x=None):
+        """Insert and return a new Edge from u to v with auxiliary element x, updating the order.
+
+        Raise a ValueError, leaving the graph unchanged, if u and v are
+        already adjacent or the edge would create a cycle.
+        """
+        if self._graph.get_edge(u, v) is not None:  # includes error checking
+            raise ValueError('u and v are already adjacent')
+        lower, upper = self._position[v], self._position[u]
+        if lower <= upper:  # v currently precedes (or is) u, so the order must change
+            forward = self._search(v, upper, True)  # affected vertices reachable from v
+            if u in forward:
+                raise ValueError('edge would create a cycle')
+            backward = self._search(u, lower, False)  # affected vertices reaching u
+            self._reorder(backward, forward)
+        return self._graph.insert_edge(u, v, x)
+
+    # ------------------------- nonpublic utilities -------------------------
+    def _search(self, start, bound, outgoing):
+        """Return the set of vertices reachable from start within the affected region.
+
+        A forward search (along outgoing edges) stays at positions up to
+        bound; a backward search (along incoming edges) stays at positions
+        from bound on.
+        """
+        found = {start}
+        stack = [start]
+        while stack:
+            w = stack.pop()
+            for e in self._graph.incident_edges(w, outgoing):
+                y = e.opposite(w)
+                p = self._position[y]
+                if y not in found and (p <= bound if outgoing else p >= bound):
+                    found.add(y)
+                    stack.append(y)
+        return found
+
+    def _reorder(self, backward, forward):
+        """Move the backward set before the forward set, reusing their positions."""
+        by_position = self._position.__getitem__
+        moved = sorted(backward, key=by_position) + sorted(forward, key=by_position)
+        slots = sorted(map(by_position, moved))
+        for p, w in zip(slots, moved):
+            self._position[w] = p
+            self._at[p] = w
+
+
+if __name__ == '__main__':
+    order = DynamicTopologicalOrder()
+    a, b, c = (order.insert_vertex(x) for x in 'ABC')
+    order.insert_edge(c, b)
+    order.insert_edge(b, a)
+    print("Order is", [str(v) for v in order])
+    try:
+        order.insert_edge(a, c)
+    except ValueError as err:
+        print("Edge (A,C) rejected:", err)
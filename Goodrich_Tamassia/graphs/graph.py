@@ -19,6 +19,10 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+import numbers
+import operator
+
+
 class Graph:
     """Representation of a simple graph using an adjacency map."""
 
@@ -165,3 +169,104 @@ class Graph:
         e = self.Edge(u, v, x)
         self._outgoing[u][v] = e
         self._incoming[v][u] = e
+        return e
+
+    def remove_edge(self, e):
+        """Remove Edge e from the graph.
+
+        Raise a ValueError if e is not an edge of the graph.
+        """
+        u, v = e.endpoints()
+        if self.get_edge(u, v) is not e:  # includes error checking
+            raise ValueError('Edge does not belong to this graph.')
+        del self._outgoing[u][v]
+        if self.is_directed() or u is not v:  # an undirected self-loop is stored once
+            del self._incoming[v][u]
+
+    def insert_vertices(self, elements):
+        """Insert a new Vertex for each element of the iterable, and return them as a list."""
+        directed = self.is_directed()
+        result = []
+        for x in elements:
+            v = self.Vertex(x)
+            self._outgoing[v] = {}
+            if directed:
+                self._incoming[v] = {}
+            result.append(v)
+        return result
+
+    def insert_edges(self, edges, vertices=None, duplicates='error'):
+        """Insert many edges in a single pass and return the number inserted.
+
+        Each item of edges is a (u,v) or (u,v,x) sequence; rows of a
+        two-dimensional NumPy array are accepted as well. By default u and v
+        must be vertices of the graph. If a sequence of vertices is given,
+        u and v are instead taken as integer indices into that sequence;
+        integral floats, as in an array with float weights, are accepted,
+        but a ValueError is raised for an index outside the sequence
+        (including a negative one) or a bool.
+
+        The duplicates policy decides what happens when u and v are already
+        adjacent: 'error' raises a ValueError, 'keep_first' ignores the new
+        edge, and 'keep_min' keeps whichever element is smaller. For
+        'keep_min', an element of None counts as no weight, so any other
+        element is kept in preference to it.
+
+        If any edge is rejected, the graph is left unchanged.
+        """
+        if duplicates not in ('error', 'keep_first', 'keep_min'):
+            raise ValueError('unknown duplicates policy: ' + repr(duplicates))
+        outgoing, incoming = self._outgoing, self._incoming
+        if vertices is not None:
+            vertices = list(vertices)
+            for v in vertices:  # validate each vertex once, not once per edge
+                self._validate_vertex(v)
+        n = len(vertices) if vertices is not None else 0
+        inserted = []  # new edges, and (edge, old element) pairs, to undo if an edge is rejected
+        replaced = []
+        try:
+            for item in edges:
+                u, v = item[0], item[1]
+                x = item[2] if len(item) > 2 else None
+                if vertices is not None:
+                    u, v = vertices[_as_index(u, n)], vertices[_as_index(v, n)]
+                elif u not in outgoing or v not in outgoing:
+                    self._validate_vertex(u)
+                    self._validate_vertex(v)
+                e = outgoing[u].get(v)
+                if e is not None:
+                    if duplicates == 'error':
+                        raise ValueError('u and v are already adjacent')
+                    if duplicates == 'keep_min' and x is not None:
+                        if e._element is None or x < e._element:  # None counts as no weight
+                            replaced.append((e, e._element))
+                            e._element = x
+                    continue
+                e = self.Edge(u, v, x)
+                outgoing[u][v] = e
+                incoming[v][u] = e
+                inserted.append(e)
+        except Exception:
+            for e in reversed(inserted):
+                self.remove_edge(e)
+            for e, x in reversed(replaced):
+                e._element = x
+            raise
+        return len(inserted)
+
+def _as_index(i, n):
+    """Return i as an int index into a sequence of length n; raise a ValueError otherwise.
+
+    Integral floats are accepted; bools and negative indices are not.
+    """
+    if isinstance(i, bool):
+        raise ValueError('vertex index must be an integer, not a bool: ' + repr(i))
+    try:
+        k = operator.index(i)
+    except TypeError:
+        if not isinstance(i, numbers.Real) or not float(i).is_integer():
+            raise ValueError('vertex index must be integral: ' + repr(i))
+        k = int(i)
+    if not 0 <= k < n:
+        raise ValueError('vertex index out of range: ' + repr(i))
+    return k
@@ -22,31 +22,27 @@
 from .graph import Graph
 
 
-def graph_from_edgelist(E, directed=False):
+def graph_from_edgelist(E, directed=False, duplicates='error'):
     """Make a graph instance based on a sequence of edge tuples.
 
     Edges can be either of from (origin,destination) or
     (origin,destination,element). Vertex set is presume to be those
     incident to at least one edge.
 
-    vertex labels are assumed to be hashable.
+    vertex labels are assumed to be hashable. The duplicates policy is
+    passed on to Graph.insert_edges.
     """
     g = Graph(directed)
-    V = set()
+    index = {}  # map from vertex label to its position in the vertex list
+    rows = []  # edges re-expressed with vertex positions
     for e in E:
-        V.add(e[0])
-        V.add(e[1])
-
-    verts = {}  # map from vertex label to Vertex instance
-    for v in V:
-        verts[v] = g.insert_vertex(v)
-
-    for e in E:
-        src = e[0]
-        dest = e[1]
-        element = e[2] if len(e) > 2 else None
-        g.insert_edge(verts[src], verts[dest], element)
+        for label in (e[0], e[1]):
+            if label not in index:
+                index[label] = len(index)
+        rows.append((index[e[0]], index[e[1]], e[2] if len(e) > 2 else None))
 
+    verts = g.insert_vertices(index)  # labels in order of first appearance
+    g.insert_edges(rows, verts, duplicates)
     return g
 
 
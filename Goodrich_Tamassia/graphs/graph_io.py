@@ -0,0 +1,118 @@
+import mmap
+import pickle
+import struct
+import sys
+from array import array
+
+from graphs.csr_graph import CSRGraph, as_csr
+
+# File layout (all sections start on an 8-byte boundary):
+#   header        magic, version, flags, vertex/slot/edge counts, element kind
+#   offsets       int64[n+1]    outgoing row boundaries
+#   targets       int64[m]      outgoing neighbor indices
+#   eids          int64[m]      edge id of each outgoing slot
+#   in_offsets, in_targets, in_eids    (directed graphs only)
+#   weights       int64[e] or float64[e]    (numeric edge elements only)
+#   side table    pickled (vertex elements, non-numeric edge elements or None)
+_MAGIC = b'CSRG'
+_VERSION = 1
+_HEADER = struct.Struct('<4sHHqqqq')
+_DIRECTED = 1
+_BIG_ENDIAN = 2
+_NO_ELEMENTS, _INT_ELEMENTS, _FLOAT_ELEMENTS, _OBJECT_ELEMENTS = range(4)
+
+
+def _pad(n):
+    """Return the number of bytes needed to bring n up to a multiple of 8."""
+    return -n % 8
+
+
+def save(g, path):
+    """Write graph g to the file at path in the binary CSR layout.
+
+    g may be a Graph or a CSRGraph; vertex and edge elements must be picklable
+    unless edge elements are all numbers.
+    """
+    g = as_csr(g)
+    elements = g._elements
+    if elements is None:
+        kind, weights, objects = _NO_ELEMENTS, None, None
+    elif isinstance(elements, list):
+        kind, weights, objects = _OBJECT_ELEMENTS, None, elements
+    else:  # a numeric array, or a memoryview of one if g was itself loaded
+        typecode = elements.typecode if isinstance(elements, array) else elements.format
+        kind, weights, objects = (_INT_ELEMENTS if typecode == 'q' else _FLOAT_ELEMENTS), elements, None
+    sections = [g._offsets, g._targets, g._eids]
+    if g.is_directed():
+        sections += [g._in_offsets, g._in_targets, g._in_eids]
+    if weights is not None:
+        sections.append(weights)
+    flags = (_DIRECTED if g.is_directed() else 0) | (_BIG_ENDIAN if sys.byteorder == 'big' else 0)
+    side = pickle.dumps(([v.element() for v in g.vertices()], objects), pickle.HIGHEST_PROTOCOL)
+    with open(path, 'wb') as f:
+        f.write(_HEADER.pack(_MAGIC, _VERSION, flags, g.vertex_count(), len(g._targets),
+                             g.edge_count(), kind))
+        f.write(bytes(_pad(_HEADER.size)))
+        for section in sections:
+            f.write(memoryview(section).cast('B'))  # lengths are multiples of 8
+        f.write(side)
+
+
+def load(path, use_mmap=True):
+    """Return the CSRGraph stored in the file at path.
+
+    By default the integer and weight arrays are memory-mapped read-only
+    rather than copied, so that every process loading the same file shares
+    one copy of them through the operating system's page cache.
+    """
+    with open(path, 'rb') as f:
+        if use_mmap:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        else:
+            data = f.read()
+    magic, version, flags, n, m, e, kind = _HEADER.unpack_from(data, 0)
+    if magic != _MAGIC:
+        raise ValueError('not a graph file')
+    if version != _VERSION:
+        raise ValueError('unsupported graph file version: {0}'.format(version))
+    swap = bool(flags & _BIG_ENDIAN) != (sys.byteorder == 'big')
+    view = memoryview(data)
+    pos = _HEADER.size + _pad(_HEADER.size)
+
+    def take(count, typecode):
+        nonlocal pos
+        chunk = view[pos:pos + 8 * count]
+        pos += 8 * count
+        if swap:  # written on a machine of other byte order, so copy
+            result = array(typecode)
+            result.frombytes(chunk)
+            result.byteswap()
+            return result
+        return chunk.cast(typecode)
+
+    offsets, targets, eids = take(n + 1, 'q'), take(m, 'q'), take(m, 'q')
+    in_arrays = (None, None, None)
+    directed = bool(flags & _DIRECTED)
+    if directed:
+        in_arrays = take(n + 1, 'q'), take(e, 'q'), take(e, 'q')
+    weights = None
+    if kind == _INT_ELEMENTS:
+        weights = take(e, 'q')
+    elif kind == _FLOAT_ELEMENTS:
+        weights = take(e, 'd')
+    vertex_elements, objects = pickle.loads(view[pos:])
+    elements = objects if kind == _OBJECT_ELEMENTS else weights
+    return CSRGraph(directed, vertex_elements, offsets, targets, eids, elements, *in_arrays)
+
+
+if __name__ == '__main__':
+    import os
+    import tempfile
+    from .graph_examples import figure_14_15 as example
+
+    path = os.path.join(tempfile.mkdtemp(), 'figure_14_15.csrg')
+    save(example(), path)
+    g = load(path)
+    print("Wrote", os.path.getsize(path), "bytes to", path)
+    print("Number of vertices is", g.vertex_count())
+    print("Number of edges is", g.edge_count())
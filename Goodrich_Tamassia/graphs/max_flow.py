@@ -0,0 +1,249 @@
+from array import array
+from collections import deque
+
+
+def max_flow(g, s, t, method='dinic'):
+    """Compute a maximum flow from vertex s to vertex t in a network.
+
+    g is a directed Graph whose edge elements are nonnegative capacities;
+    each edge of an undirected graph has that capacity in both directions.
+    method selects the algorithm: 'dinic' for Dinic's blocking flows, or
+    'push_relabel' for FIFO push-relabel with the gap and global
+    relabeling heuristics.
+
+    Return a (value, flow, cut) tuple, where value is the maximum flow,
+    flow maps each edge of g to the flow it carries (negative if it flows
+    from destination to origin of an undirected edge), and cut is the set
+    of vertices on the source side of a minimum cut.
+    """
+    if method not in _METHODS:
+        raise ValueError('unknown method: ' + repr(method))
+    if s is t:
+        raise ValueError('source and sink must differ')
+    net = _ResidualNetwork(g)
+    i, j = net.index[s], net.index[t]
+    value = _METHODS[method](net, i, j)
+    flow = {e: net.capacity[2 * k] - net.residual[2 * k] for k, e in enumerate(net.edges)}
+    reached = net.reachable(i)
+    cut = {v for v in net.verts if reached[net.index[v]]}
+    return value, flow, cut
+
+
+class _ResidualNetwork:
+    """Residual graph in arrays: arc 2k follows edge k, and arc 2k+1 is its reverse."""
+
+    def __init__(self, g):
+        self.verts = list(g.vertices())
+        self.index = {v: i for i, v in enumerate(self.verts)}
+        self.edges = list(g.edges())
+        n = len(self.verts)
+        self.head = array('q')  # vertex index each arc points to
+        self.capacity = []
+        for e in self.edges:
+            u, v = e.endpoints()
+            c = e.element()
+            self.head.append(self.index[v])
+            self.head.append(self.index[u])
+            self.capacity.append(c)
+            self.capacity.append(0 if g.is_directed() else c)
+        self.residual = list(self.capacity)
+        # arcs leaving each vertex, grouped in CSR form
+        self.offsets = array('q', [0]) * (n + 1)
+        for a in range(len(self.head)):
+            self.offsets[self.head[a ^ 1] + 1] += 1  # tail of a is head of its reverse
+        for i in range(n):
+            self.offsets[i + 1] += self.offsets[i]
+        fill = array('q', self.offsets[:n])
+        self.arcs = array('q', [0]) * len(self.head)
+        for a in range(len(self.head)):
+            tail = self.head[a ^ 1]
+            self.arcs[fill[tail]] = a
+            fill[tail] += 1
+
+    def vertex_count(self):
+        return len(self.verts)
+
+    def reachable(self, s):
+        """Return a bytearray marking the vertices reachable from s along residual arcs."""
+        seen = bytearray(len(self.verts))
+        seen[s] = 1
+        stack = [s]
+        while stack:
+            u = stack.pop()
+            for k in range(self.offsets[u], self.offsets[u + 1]):
+                a = self.arcs[k]
+                w = self.head[a]
+                if self.residual[a] > 0 and not seen[w]:
+                    seen[w] = 1
+                    stack.append(w)
+        return seen
+
+    def distances_to(self, t):
+        """Return the number of residual arcs on a shortest path from each vertex to t (-1 if none)."""
+        dist = array('q', [-1]) * len(self.verts)
+        dist[t] = 0
+        queue = deque([t])
+        while queue:
+            w = queue.popleft()
+            for k in range(self.offsets[w], self.offsets[w + 1]):
+                a = self.arcs[k] ^ 1  # arc entering w
+                u = self.head[a ^ 1]
+                if self.residual[a] > 0 and dist[u] == -1:
+                    dist[u] = dist[w] + 1
+                    queue.append(u)
+        return dist
+
+
+def _dinic(net, s, t):
+    """Dinic's algorithm: repeated blocking flows in the BFS level graph from s."""
+    n = net.vertex_count()
+    head, residual, arcs, offsets = net.head, net.residual, net.arcs, net.offsets
+    total = 0
+    while True:
+        level = array('q', [-1]) * n
+        level[s] = 0
+        queue = deque([s])
+        while queue:
+            u = queue.popleft()
+            for k in range(offsets[u], offsets[u + 1]):
+                a = arcs[k]
+                if residual[a] > 0 and level[head[a]] == -1:
+                    level[head[a]] = level[u] + 1
+                    queue.append(head[a])
+        if level[t] == -1:
+            return total
+        current = array('q', offsets[:n])  # next arc to try at each vertex
+        path = []  # arcs from s to u
+        u = s
+        while True:
+            if u == t:
+                f = min(residual[a] for a in path)
+                total += f
+                retreat = len(path)
+                for i, a in enumerate(path):
+                    residual[a] -= f
+                    residual[a ^ 1] += f
+                    if residual[a] == 0 and i < retreat:
+                        retreat = i  # resume from the tail of the first saturated arc
+                del path[retreat:]
+                u = head[path[-1]] if path else s
+                continue
+            while current[u] < offsets[u + 1]:
+                a = arcs[current[u]]
+                if residual[a] > 0 and level[head[a]] == level[u] + 1:
+                    break
+                current[u] += 1
+            if current[u] < offsets[u + 1]:  # advance along an admissible arc
+                a = arcs[current[u]]
+                path.append(a)
+                u = head[a]
+            elif u == s:
+                break  # blocking flow found
+            else:  # dead end: retreat and never return to u in this phase
+                level[u] = -1
+                a = path.pop()
+                u = head[a ^ 1]
+                current[u] += 1
+
+
+def _push_relabel(net, s, t):
+    """FIFO push-relabel with gap and global relabeling heuristics."""
+    n = net.vertex_count()
+    head, residual, arcs, offsets = net.head, net.residual, net.arcs, net.offsets
+    height = array('q', [0]) * n
+    excess = [0] * n
+    count = array('q', [0]) * (2 * n + 1)  # number of vertices at each height
+    current = array('q', offsets[:n])
+    active = deque()
+
+    def global_relabel():
+        """Set every height to its exact residual distance to t, or n plus the distance to s."""
+        to_t = net.distances_to(t)
+        to_s = net.distances_to(s)
+        for i in range(len(count)):
+            count[i] = 0
+        for v in range(n):
+            if v == s:
+                height[v] = n
+            elif to_t[v] >= 0:
+                height[v] = to_t[v]
+            elif to_s[v] >= 0:
+                height[v] = n + to_s[v]
+            else:
+                height[v] = 2 * n  # can neither reach t nor return excess to s
+            count[height[v]] += 1
+            current[v] = offsets[v]
+
+    for k in range(offsets[s], offsets[s + 1]):  # saturate every arc leaving s
+        a = arcs[k]
+        f = residual[a]
+        if f > 0:
+            w = head[a]
+            residual[a] -= f
+            residual[a ^ 1] += f
+            excess[w] += f
+            excess[s] -= f
+            if w != t and excess[w] == f:
+                active.append(w)
+    global_relabel()
+    relabels = 0
+    while active:
+        u = active.popleft()
+        if height[u] >= 2 * n:
+            continue
+        while excess[u] > 0:
+            if current[u] == offsets[u + 1]:  # relabel u
+                old = height[u]
+                lowest = 2 * n
+                for k in range(offsets[u], offsets[u + 1]):
+                    a = arcs[k]
+                    if residual[a] > 0 and height[head[a]] < lowest:
+                        lowest = height[head[a]]
+                height[u] = min(lowest + 1, 2 * n)
+                current[u] = offsets[u]
+                count[old] -= 1
+                count[height[u]] += 1
+                relabels += 1
+                if old < n and count[old] == 0:  # gap: vertices above old cannot reach t
+                    for v in range(n):
+                        if old < height[v] < n:
+                            count[height[v]] -= 1
+                            height[v] = n + 1
+                            count[n + 1] += 1
+                if height[u] >= 2 * n:
+                    break
+                if relabels % n == 0:
+                    global_relabel()
+                continue
+            a = arcs[current[u]]
+            w = head[a]
+            if residual[a] > 0 and height[u] == height[w] + 1:  # push along admissible arc
+                f = min(excess[u], residual[a])
+                residual[a] -= f
+                residual[a ^ 1] += f
+                excess[u] -= f
+                excess[w] += f
+                if w != s and w != t and excess[w] == f:
+                    active.append(w)
+            else:
+                current[u] += 1
+    return excess[t]
+
+
+_METHODS = {
+    'dinic': _dinic,
+    'push_relabel': _push_relabel,
+}
+
+
+if __name__ == '__main__':
+    from .graph_examples import graph_from_edgelist
+
+    g = graph_from_edgelist((
+        ('s', 'a', 10), ('s', 'b', 5), ('a', 'b', 15), ('a', 'c', 9),
+        ('b', 'd', 8), ('d', 'a', 6), ('c', 'd', 15), ('c', 't', 10), ('d', 't', 10),
+    ), True)
+    verts = {v.element(): v for v in g.vertices()}
+    for method in _METHODS:
+        value, flow, cut = max_flow(g, verts['s'], verts['t'], method)
+        print(method, value, sorted(str(v) for v in cut))
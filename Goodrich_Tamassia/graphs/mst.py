@@ -18,9 +18,12 @@
 #
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
-from graphs.partition import Partition
+import random
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+
+from graphs.partition import UnionFind
 from priority_queues.adaptable_pq import AdaptableHeapPriorityQueue
-from priority_queues.heap_pq import HeapPriorityQueue
 
 
 def MST_PrimJarnik(g):
@@ -63,30 +66,158 @@ def MST_PrimJarnik(g):
 def MST_Kruskal(g):
     """Compute a minimum spanning tree of a graph using Kruskal's algorithm.
 
-    Return a list of edges that comprise the MST.
+    Return a list of edges that comprise the MST. If g is disconnected,
+    the result is a minimum spanning forest, with a tree for each component.
 
-    The elements of the graph's edges are assumed to be weights.
+    The elements of the graph's edges are assumed to be weights. Edges are
+    sorted once by weight, and the scan stops as soon as the tree spans g.
     """
-    tree = []  # list of edges in spanning tree
-    pq = HeapPriorityQueue()  # entries are edges in G, with weights as key
-    forest = Partition()  # keeps track of forest clusters
-    position = {}  # map each node to its Partition entry
+    edges, sources, destinations, weights = _edge_arrays(g)
+    order = sorted(range(len(edges)), key=weights.__getitem__)
+    forest = UnionFind(g.vertex_count())  # keeps track of forest clusters
+    tree = []
+    _kruskal_scan(order, edges, sources, destinations, forest, tree)
+    return tree
 
-    for v in g.vertices():
-        position[v] = forest.make_group(v)
-
-    for e in g.edges():
-        pq.add(e.element(), e)  # edge's element is assumed to be its weight
-
-    size = g.vertex_count()
-    while len(tree) != size - 1 and not pq.is_empty():
-        # tree not spanning and unprocessed edges remain
-        weight, edge = pq.remove_min()
-        u, v = edge.endpoints()
-        a = forest.find(position[u])
-        b = forest.find(position[v])
-        if a != b:
-            tree.append(edge)
-            forest.union(a, b)
 
+def MST_FilterKruskal(g, threshold=1024):
+    """Compute a minimum spanning tree (or forest) of a graph using filter-Kruskal.
+
+    Like quicksort, edges are split around a random pivot weight; the
+    lighter part is processed first, and the heavier part is then filtered
+    to remove edges whose endpoints are already connected before it is
+    processed in turn. Parts of at most threshold edges are sorted and
+    scanned directly. Heavy edges that can never join the tree are thus
+    discarded without being sorted.
+
+    Return a list of edges, as for MST_Kruskal.
+    """
+    edges, sources, destinations, weights = _edge_arrays(g)
+    forest = UnionFind(g.vertex_count())
+    tree = []
+    pending = [(list(range(len(edges))), False)]  # stack of (edge ids, needs filtering)
+    while pending and forest.group_count() > 1:
+        part, heavy = pending.pop()
+        if heavy:
+            part = [k for k in part if forest.find(sources[k]) != forest.find(destinations[k])]
+        if len(part) <= threshold:
+            part.sort(key=weights.__getitem__)
+            _kruskal_scan(part, edges, sources, destinations, forest, tree)
+            continue
+        pivot = weights[random.choice(part)]
+        light = [k for k in part if weights[k] <= pivot]
+        if len(light) == len(part):  # every weight is at most the pivot
+            part.sort(key=weights.__getitem__)
+            _kruskal_scan(part, edges, sources, destinations, forest, tree)
+            continue
+        pending.append(([k for k in part if weights[k] > pivot], True))
+        pending.append((light, False))  # light edges are processed first
+    return tree
+
+
+def MST_Boruvka(g, processes=None, chunk_size=50000):
+    """Compute a minimum spanning tree (or forest) of a graph using Boruvka's algorithm.
+
+    Each round finds the cheapest edge leaving every component, adds all of
+    those edges at once, and contracts the merged components, discarding
+    edges that became internal and keeping only the lightest of parallel
+    edges. At least half of the components disappear in every round.
+
+    Edges are ranked by weight once up front, so the remaining links are
+    kept as plain integer arrays and ties are broken consistently. The
+    per-round scan for cheapest links is independent for each chunk of
+    links, so if processes is given, chunks of chunk_size links are
+    scanned by that many worker processes.
+
+    Return a list of edges, as for MST_Kruskal.
+    """
+    edges, sources, destinations, weights = _edge_arrays(g)
+    order = sorted(range(len(edges)), key=weights.__getitem__)  # edge id of each rank
+    forest = UnionFind(g.vertex_count())
+    tree = []
+    # remaining links between components: ends[0][i] and ends[1][i] joined by edge of rank[i]
+    ends, rank = (array('q'), array('q')), array('q')
+    for r, k in enumerate(order):
+        if sources[k] != destinations[k]:
+            ends[0].append(sources[k])
+            ends[1].append(destinations[k])
+            rank.append(r)
+    pool = ProcessPoolExecutor(processes) if processes else None
+    try:
+        while rank:
+            if pool is not None and len(rank) > chunk_size:
+                bounds = range(0, len(rank), chunk_size)
+                partial = pool.map(_cheapest_links,
+                                   [ends[0][i:i + chunk_size] for i in bounds],
+                                   [ends[1][i:i + chunk_size] for i in bounds],
+                                   [rank[i:i + chunk_size] for i in bounds])
+            else:
+                partial = [_cheapest_links(ends[0], ends[1], rank)]
+            cheapest = {}
+            for result in partial:
+                for c, r in result.items():
+                    if r < cheapest.get(c, len(order)):
+                        cheapest[c] = r
+            for r in cheapest.values():
+                k = order[r]
+                if forest.union(sources[k], destinations[k]):
+                    tree.append(edges[k])
+            ends, rank = _contract_links(ends, rank, forest)
+    finally:
+        if pool is not None:
+            pool.shutdown()
     return tree
+
+
+def _cheapest_links(first, second, rank):
+    """Return a map from each component to the lowest rank among its links."""
+    cheapest = {}
+    for i in range(len(rank)):
+        r = rank[i]
+        for c in (first[i], second[i]):
+            if r < cheapest.get(c, r + 1):
+                cheapest[c] = r
+    return cheapest
+
+
+def _contract_links(ends, rank, forest):
+    """Relabel links by their merged components, dropping internal and non-minimal parallel links."""
+    lightest = {}
+    first, second = ends
+    for i in range(len(rank)):
+        a, b = forest.find(first[i]), forest.find(second[i])
+        if a != b:
+            pair = (a, b) if a < b else (b, a)
+            if rank[i] < lightest.get(pair, rank[i] + 1):
+                lightest[pair] = rank[i]
+    ends, result = (array('q'), array('q')), array('q')
+    for (a, b), r in lightest.items():
+        ends[0].append(a)
+        ends[1].append(b)
+        result.append(r)
+    return ends, result
+
+
+def _edge_arrays(g):
+    """Return (edges, sources, destinations, weights) lists describing the edges of g.
+
+    Endpoints are given by their position in g.vertices().
+    """
+    index = {v: i for i, v in enumerate(g.vertices())}
+    edges = list(g.edges())
+    sources, destinations, weights = [], [], []
+    for e in edges:
+        u, v = e.endpoints()
+        sources.append(index[u])
+        destinations.append(index[v])
+        weights.append(e.element())  # edge's element is assumed to be its weight
+    return edges, sources, destinations, weights
+
+
+def _kruskal_scan(order, edges, sources, destinations, forest, tree):
+    """Add to tree each edge, taken in the given order, that joins two clusters of forest."""
+    for k in order:
+        if forest.group_count() == 1:
+            break  # tree is spanning
+        if forest.union(sources[k], destinations[k]):
+            tree.append(edges[k])
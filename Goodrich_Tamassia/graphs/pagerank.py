@@ -0,0 +1,238 @@
+from graphs.csr_graph import as_csr
+
+
+def pagerank(g, damping=0.85, personalization=None, tol=1e-10, max_iter=100):
+    """Compute the PageRank of every vertex of directed graph g by sparse power iteration.
+
+    A random surfer follows a uniformly chosen outgoing edge with
+    probability damping, and otherwise teleports to a vertex drawn from
+    the personalization distribution: a map from vertices to nonnegative
+    weights (missing vertices have weight 0), uniform by default. Surfers
+    at a vertex without outgoing edges always teleport. Neither case is
+    stored as matrix entries; both are folded into one scalar per step.
+
+    g may be a Graph, CompactGraph or CSRGraph; an edge stream can be
+    ranked through CSRGraph.from_edgelist(edges, directed=True). Each
+    iteration pulls rank along incoming edges in the CSR arrays, in time
+    linear in the number of edges.
+
+    Iteration stops once the L1 change falls below tol, or after max_iter
+    iterations. Return dictionary mapping each vertex to its rank; ranks
+    sum to 1.
+    """
+    csr = as_csr(g)
+    verts = list(g.vertices())
+    n = len(verts)
+    if n == 0:
+        return {}
+    teleport = _teleport_vector(verts, personalization)
+    rank = _power_iteration(csr, damping, teleport, list(teleport), tol, max_iter)
+    return dict(zip(verts, rank))
+
+
+def _teleport_vector(verts, personalization):
+    """Return the teleport distribution, as a list indexed like verts."""
+    n = len(verts)
+    if personalization is None:
+        return [1.0 / n] * n if n else []
+    weights = [float(personalization.get(v, 0)) for v in verts]
+    total = sum(weights)
+    if total <= 0 or min(weights) < 0:
+        raise ValueError('personalization weights must be nonnegative and not all zero')
+    return [w / total for w in weights]
+
+
+def _power_iteration(csr, damping, teleport, rank, tol, max_iter):
+    """Run power iteration from the given rank list over the CSR arrays of a graph.
+
+    Return the final rank list.
+    """
+    n = csr.vertex_count()
+    offsets, in_offsets, in_targets = csr._offsets, csr._in_offsets, csr._in_targets
+    out_degree = [offsets[i + 1] - offsets[i] for i in range(n)]
+    dangling = [i for i in range(n) if out_degree[i] == 0]
+    for _ in range(max_iter):
+        # share of rank each vertex sends along every one of its outgoing edges
+        share = [rank[i] / out_degree[i] if out_degree[i] else 0.0 for i in range(n)]
+        # rank that teleports: from damping, plus all rank at dangling vertices
+        jump = (1 - damping) + damping * sum(rank[i] for i in dangling)
+        new_rank = [damping * sum(map(share.__getitem__, in_targets[in_offsets[v]:in_offsets[v + 1]]))
+                    + jump * teleport[v] for v in range(n)]
+        change = sum(abs(new_rank[v] - rank[v]) for v in range(n))
+        rank = new_rank
+        if change < tol:
+            break
+    return rank
+
+
+class IncrementalPageRank:
+    """PageRank of a directed graph, kept up to date as edges are added and removed.
+
+    The ranks x are maintained together with the residual
+    r = (1-d)p + d(transition of x) - x of the PageRank equations, where p
+    is the teleport distribution. A push at vertex u moves r[u] into x[u]
+    and passes d*r[u] on to u's out-neighbors; pushing the vertices with
+    the largest residual first (Gauss-Southwell) concentrates the work
+    where the ranks are furthest from settled. Changing the edges at u only
+    perturbs the residual at u's out-neighbors, so after an update the
+    pushes stay local to the changed region. Rank that a dangling vertex
+    passes on through teleportation is accumulated as a scalar and spread
+    over all vertices only when it becomes significant.
+
+    At all times the L1 distance from the exact ranks is at most
+    error_bound(), which each update brings below tol.
+    """
+
+    def __init__(self, g, damping=0.85, personalization=None, tol=1e-8, initial=None):
+        """Rank the vertices of graph g.
+
+        The ranker keeps its own copy of g's edges; later changes are made
+        through add_edges and remove_edges, not by modifying g. initial is
+        an optional map from vertices to previous ranks to warm-start from.
+        """
+        self._verts = list(g.vertices())
+        self._index = {v: i for i, v in enumerate(self._verts)}
+        n = len(self._verts)
+        self._damping = damping
+        self._tol = tol
+        self._teleport = _teleport_vector(self._verts, personalization)
+        self._out = [set() for _ in range(n)]  # out-neighbor indices of each vertex
+        for u in self._verts:
+            i = self._index[u]
+            for e in g.incident_edges(u):
+                self._out[i].add(self._index[e.opposite(u)])
+        if initial is None:  # start from power iteration, which is faster from scratch
+            self._rank = _power_iteration(as_csr(g), damping, self._teleport, list(self._teleport),
+                                          tol * (1 - damping), 200)
+        else:
+            self._rank = [float(initial.get(v, 0)) for v in self._verts]
+        self._residual = self._exact_residual()
+        self._pending = 0.0  # teleported rank owed to every vertex v in proportion to p[v]
+        self._settle(range(n))
+
+    # ------------------------- nonpublic utilities -------------------------
+    def _exact_residual(self):
+        """Return the residual of the current ranks, computed from scratch."""
+        d, x = self._damping, self._rank
+        r = [(1 - d) * p - xv for p, xv in zip(self._teleport, x)]
+        jump = 0.0
+        for u, targets in enumerate(self._out):
+            if targets:
+                share = d * x[u] / len(targets)
+                for w in targets:
+                    r[w] += share
+            else:
+                jump += d * x[u]
+        for v, p in enumerate(self._teleport):
+            r[v] += jump * p
+        return r
+
+    def _settle(self, touched):
+        """Push residual until the error bound falls below tol, starting from the touched vertices.
+
+        Work proceeds in rounds. Each round pushes the active vertices whose
+        residual exceeds a threshold chosen so that they hold at least half
+        of the active residual, so pushes go where the residual is largest.
+        """
+        d, x, r, out, teleport = self._damping, self._rank, self._residual, self._out, self._teleport
+        target = self._tol * (1 - d)  # bound on the L1 norm of the residual
+        eps = target / (2 * len(r)) if r else 0  # residual never worth pushing on its own
+        active = {i for i in touched if abs(r[i]) > eps}
+        norm = sum(map(abs, r))
+        while norm + abs(self._pending) > target:
+            if abs(self._pending) > target / 2 or not active:  # spread the accumulated teleported rank
+                for v, p in enumerate(teleport):
+                    r[v] += self._pending * p
+                self._pending = 0.0
+                active = {v for v, rv in enumerate(r) if abs(rv) > eps}
+                norm = sum(map(abs, r))  # also discards rounding drift in the running total
+                continue
+            threshold = max(eps, sum(abs(r[v]) for v in active) / (2 * len(active)))
+            pushed = [v for v in active if abs(r[v]) > threshold]
+            for u in pushed:
+                delta = r[u]
+                x[u] += delta
+                r[u] = 0.0
+                norm -= abs(delta)
+                if out[u]:
+                    share = d * delta / len(out[u])
+                    for w in out[u]:
+                        old = r[w]
+                        r[w] = old + share
+                        norm += abs(old + share) - abs(old)
+                        active.add(w)
+                else:
+                    self._pending += d * delta
+            active = {v for v in active if abs(r[v]) > eps}
+
+    def _update(self, edges, insert):
+        """Apply a batch of edge insertions or removals, then settle the residual."""
+        d, x, r = self._damping, self._rank, self._residual
+        touched = set()
+        for u, v in edges:
+            i, j = self._index[u], self._index[v]
+            targets = self._out[i]
+            if (j in targets) == insert:
+                continue  # nothing to change
+            # withdraw what x[i] currently sends, then send it along the new edges
+            if targets:
+                share = d * x[i] / len(targets)
+                for w in targets:
+                    r[w] -= share
+                touched.update(targets)
+            else:
+                self._pending -= d * x[i]
+            if insert:
+                targets.add(j)
+            else:
+                targets.discard(j)
+            if targets:
+                share = d * x[i] / len(targets)
+                for w in targets:
+                    r[w] += share
+                touched.update(targets)
+            else:
+                self._pending += d * x[i]
+            touched.add(j)
+        self._settle(touched)
+
+    # ------------------------- public IncrementalPageRank methods -------------------------
+    def rank(self, v):
+        """Return the current rank of vertex v."""
+        return self._rank[self._index[v]]
+
+    def ranks(self):
+        """Return dictionary mapping each vertex to its current rank."""
+        return dict(zip(self._verts, self._rank))
+
+    def error_bound(self):
+        """Return an upper bound on the L1 distance between the current and exact ranks."""
+        return (sum(map(abs, self._residual)) + abs(self._pending)) / (1 - self._damping)
+
+    def add_edges(self, edges):
+        """Add each (u, v) edge between vertices of the graph and update the ranks.
+
+        Edges already present are ignored.
+        """
+        self._update(edges, True)
+
+    def remove_edges(self, edges):
+        """Remove each (u, v) edge and update the ranks.
+
+        Edges not present are ignored.
+        """
+        self._update(edges, False)
+
+
+if __name__ == '__main__':
+    from .graph_examples import figure_14_8 as example
+
+    g = example()
+    ranks = pagerank(g)
+    for v in sorted(ranks, key=ranks.get, reverse=True):
+        print(v, round(ranks[v], 4))
+    ranker = IncrementalPageRank(g, tol=1e-6)
+    verts = {v.element(): v for v in g.vertices()}
+    ranker.add_edges([(verts['LAX'], verts['BOS'])])
+    print("After adding (LAX,BOS):", round(ranker.rank(verts['BOS']), 4),
+          "within", ranker.error_bound())
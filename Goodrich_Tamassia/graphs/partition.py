@@ -19,24 +19,117 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+from array import array
+
+
+class UnionFind:
+    """Union-find structure over the integers 0 to n-1, backed by integer arrays.
+
+    Uses union by size and iterative path halving, so operations run in
+    nearly constant amortized time without recursion or per-element objects.
+    """
+
+    def __init__(self, n=0):
+        """Create a structure with n singleton groups, 0 to n-1."""
+        self._parent = array('i', range(n))
+        self._size = array('i', [1]) * n
+        self._count = n  # number of groups
+
+    def __len__(self):
+        """Return the number of elements."""
+        return len(self._parent)
+
+    def make_set(self):
+        """Add a new element in a group of its own, and return it."""
+        i = len(self._parent)
+        self._parent.append(i)
+        self._size.append(1)
+        self._count += 1
+        return i
+
+    def find(self, i):
+        """Return the leader of the group containing element i."""
+        parent = self._parent
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]  # path halving: skip to grandparent
+            i = parent[i]
+        return i
+
+    def union(self, i, j):
+        """Merge the groups containing elements i and j; return True if they were distinct."""
+        a = self.find(i)
+        b = self.find(j)
+        if a == b:
+            return False
+        if self._size[a] > self._size[b]:
+            a, b = b, a
+        self._parent[a] = b  # smaller group joins larger
+        self._size[b] += self._size[a]
+        self._count -= 1
+        return True
+
+    def union_many(self, pairs):
+        """Merge the groups of each (i, j) pair; return the number of merges performed."""
+        merges = 0
+        for i, j in pairs:
+            if self.union(i, j):
+                merges += 1
+        return merges
+
+    def connected(self, i, j):
+        """Return True if elements i and j are in the same group."""
+        return self.find(i) == self.find(j)
+
+    def group_size(self, i):
+        """Return the number of elements in the group containing i."""
+        return self._size[self.find(i)]
+
+    def group_count(self):
+        """Return the number of groups."""
+        return self._count
+
+    def labels(self):
+        """Return an array giving each element a group label from 0 to group_count()-1.
+
+        Labels are assigned in order of each group's first element.
+        """
+        label = array('i', [-1]) * len(self._parent)
+        result = array('i', [0]) * len(self._parent)
+        next_label = 0
+        for i in range(len(self._parent)):
+            leader = self.find(i)
+            if label[leader] == -1:
+                label[leader] = next_label
+                next_label += 1
+            result[i] = label[leader]
+        return result
+
+
 class Partition:
-    """Union-find structure for maintaining disjoint sets."""
+    """Union-find structure for maintaining disjoint sets.
+
+    Positions are a thin layer over a UnionFind of their integer indices.
+    """
 
     # ------------------------- nested Position class -------------------------
     class Position:
-        __slots__ = '_container', '_element', '_size', '_parent'
+        __slots__ = '_container', '_element', '_index'
 
-        def __init__(self, container, e):
+        def __init__(self, container, e, i):
             """Create a new position that is the leader of its own group."""
             self._container = container  # reference to Partition instance
             self._element = e
-            self._size = 1
-            self._parent = self  # convention for a group leader
+            self._index = i  # element of the underlying UnionFind
 
         def element(self):
             """Return element stored at this position."""
             return self._element
 
+    def __init__(self):
+        """Create an empty partition."""
+        self._groups = UnionFind()
+        self._positions = []  # position of each UnionFind element
+
     # ------------------------- nonpublic utility -------------------------
     def _validate(self, p):
         if not isinstance(p, self.Position):
@@ -47,23 +140,17 @@ class Partition:
     # ------------------------- public Partition methods -------------------------
     def make_group(self, e):
         """Makes a new group containing element e, and returns its Position."""
-        return self.Position(self, e)
+        p = self.Position(self, e, self._groups.make_set())
+        self._positions.append(p)
+        return p
 
     def find(self, p):
         """Finds the group containging p and return the position of its leader."""
         self._validate(p)
-        if p._parent != p:
-            p._parent = self.find(p._parent)  # overwrite p._parent after recursion
-        return p._parent
+        return self._positions[self._groups.find(p._index)]
 
     def union(self, p, q):
         """Merges the groups containg elements p and q (if distinct)."""
-        a = self.find(p)
-        b = self.find(q)
-        if a is not b:  # only merge if different groups
-            if a._size > b._size:
-                b._parent = a
-                a._size += b._size
-            else:
-                a._parent = b
-                b._size += a._size
+        self._validate(p)
+        self._validate(q)
+        self._groups.union(p._index, q._index)
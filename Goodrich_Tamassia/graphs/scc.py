@@ -0,0 +1,156 @@
+from array import array
+
+from graphs.csr_graph import as_csr
+from graphs.graph import Graph
+
+
+def tarjan_scc(g):
+    """Compute the strongly connected components of graph g with Tarjan's algorithm.
+
+    Return a (count, label) tuple, where label is an integer array such that
+    label[i] is the component of the i-th vertex of g.vertices(). Components
+    are numbered from 0 to count-1 in reverse topological order of the
+    condensation (a component can only reach lower-numbered ones).
+    """
+    csr = as_csr(g)
+    return _tarjan(csr.vertex_count(), csr._offsets, csr._targets)
+
+
+def kosaraju_scc(g):
+    """Compute the strongly connected components of graph g with Kosaraju's algorithm.
+
+    Return a (count, label) tuple as for tarjan_scc, except that components
+    are numbered in topological order (a component can only reach
+    higher-numbered ones). One DFS over outgoing edges orders the vertices
+    by finishing time; a second over incoming edges, in reverse order of
+    finishing, collects one component per search tree.
+    """
+    csr = as_csr(g)
+    n = csr.vertex_count()
+    offsets, targets = csr._offsets, csr._targets
+    finished = []  # vertex indices in order of finishing time
+    seen = bytearray(n)
+    for root in range(n):
+        if seen[root]:
+            continue
+        seen[root] = 1
+        work = [(root, offsets[root])]
+        while work:
+            v, k = work[-1]
+            if k < offsets[v + 1]:
+                work[-1] = (v, k + 1)
+                w = targets[k]
+                if not seen[w]:
+                    seen[w] = 1
+                    work.append((w, offsets[w]))
+            else:
+                work.pop()
+                finished.append(v)
+    in_offsets, in_targets = csr._in_offsets, csr._in_targets
+    label = array('l', [-1]) * n
+    count = 0
+    for root in reversed(finished):
+        if label[root] != -1:
+            continue
+        label[root] = count
+        stack = [root]
+        while stack:
+            v = stack.pop()
+            for k in range(in_offsets[v], in_offsets[v + 1]):
+                w = in_targets[k]
+                if label[w] == -1:
+                    label[w] = count
+                    stack.append(w)
+        count += 1
+    return count, label
+
+
+def condensation(g, components=None):
+    """Return the condensation of graph g, the DAG of its strongly connected components.
+
+    components is a (count, label) tuple as returned by tarjan_scc or
+    kosaraju_scc; it is computed with tarjan_scc if not given.
+
+    Return a (dag, mapping) tuple. dag is a directed Graph with one vertex
+    per component, inserted in order of component number, whose element is
+    the list of vertices of g in that component; it has an edge (with
+    element None) from one component to another whenever g has an edge
+    between their members. mapping maps each vertex of g to its vertex of dag.
+    """
+    count, label = tarjan_scc(g) if components is None else components
+    verts = list(g.vertices())
+    members = [[] for _ in range(count)]
+    for i, v in enumerate(verts):
+        members[label[i]].append(v)
+    dag = Graph(directed=True)
+    nodes = dag.insert_vertices(members)
+    index = {v: i for i, v in enumerate(verts)}
+    links = []
+    for e in g.edges():
+        u, v = e.endpoints()
+        a, b = label[index[u]], label[index[v]]
+        if a != b:
+            links.append((a, b))
+            if not g.is_directed():
+                links.append((b, a))
+    dag.insert_edges(links, nodes, duplicates='keep_first')
+    return dag, {v: nodes[label[i]] for i, v in enumerate(verts)}
+
+
+def _tarjan(n, offsets, targets):
+    """Return (count, label) for the strongly connected components of a CSR adjacency.
+
+    Uses an iterative form of Tarjan's algorithm; label[i] is the component
+    of vertex index i, with components numbered in reverse topological order.
+    """
+    order = [-1] * n  # discovery number of each vertex
+    low = [0] * n
+    on_stack = bytearray(n)
+    stack = []
+    label = array('l', [-1]) * n
+    count = counter = 0
+    for root in range(n):
+        if order[root] != -1:
+            continue
+        order[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack[root] = 1
+        work = [(root, offsets[root])]  # vertices being explored, with next slot to examine
+        while work:
+            v, k = work[-1]
+            if k < offsets[v + 1]:
+                work[-1] = (v, k + 1)
+                w = targets[k]
+                if order[w] == -1:
+                    order[w] = low[w] = counter
+                    counter += 1
+                    stack.append(w)
+                    on_stack[w] = 1
+                    work.append((w, offsets[w]))
+                elif on_stack[w] and order[w] < low[v]:
+                    low[v] = order[w]
+            else:
+                work.pop()
+                if work and low[v] < low[work[-1][0]]:
+                    low[work[-1][0]] = low[v]
+                if low[v] == order[v]:  # v is the root of a component
+                    while True:
+                        w = stack.pop()
+                        on_stack[w] = 0
+                        label[w] = count
+                        if w == v:
+                            break
+                    count += 1
+    return count, label
+
+
+if __name__ == '__main__':
+    from .graph_examples import figure_14_8 as example
+
+    g = example()
+    count, label = tarjan_scc(g)
+    print("Number of components is", count)
+    dag, mapping = condensation(g, (count, label))
+    for c in dag.vertices():
+        print([str(v) for v in c.element()])
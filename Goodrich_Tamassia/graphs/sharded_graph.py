@@ -0,0 +1,335 @@
+import random
+from array import array
+from heapq import heapify, heappop, heappush
+from multiprocessing import Pipe, Process
+
+
+def partition_graph(g, k, rounds=10, imbalance=1.05, seed=None):
+    """Split the vertices of graph g into k shards of roughly equal size with few cut edges.
+
+    Shards start as consecutive runs of a breadth-first order of g, so each
+    is a connected region where possible. Rounds of label propagation then
+    move each vertex, in random order, to the shard holding most of its
+    neighbors, as long as that shard stays within imbalance times the
+    average shard size. Edge direction is ignored.
+
+    Return (labels, cut), where labels is an integer array giving the shard
+    of each vertex by its position in g.vertices(), and cut is the list of
+    edges whose endpoints lie in different shards.
+    """
+    if k < 1:
+        raise ValueError('k must be positive')
+    verts = list(g.vertices())
+    index = {v: i for i, v in enumerate(verts)}
+    n = len(verts)
+    neighbors = [[] for _ in range(n)]
+    for e in g.edges():
+        u, v = e.endpoints()
+        i, j = index[u], index[v]
+        if i != j:
+            neighbors[i].append(j)
+            neighbors[j].append(i)
+    labels = array('l', [0]) * n
+    size = [0] * k
+    for position, i in enumerate(_breadth_first_order(neighbors)):
+        labels[i] = position * k // n
+        size[labels[i]] += 1
+    capacity = max(1, int(imbalance * n / k))
+    order = list(range(n))
+    rng = random.Random(seed)
+    for _ in range(rounds):
+        rng.shuffle(order)
+        moved = 0
+        for i in order:
+            votes = {}
+            for j in neighbors[i]:
+                votes[labels[j]] = votes.get(labels[j], 0) + 1
+            current = labels[i]
+            best, most = current, votes.get(current, 0)
+            for shard, count in votes.items():
+                if count > most and size[shard] < capacity:
+                    best, most = shard, count
+            if best != current:
+                size[current] -= 1
+                size[best] += 1
+                labels[i] = best
+                moved += 1
+        if moved == 0:
+            break
+    cut = [e for e in g.edges() if labels[index[e.endpoints()[0]]] != labels[index[e.endpoints()[1]]]]
+    return labels, cut
+
+
+def _breadth_first_order(neighbors):
+    """Return all vertex indices in the order of a complete breadth-first search."""
+    seen = bytearray(len(neighbors))
+    order = []
+    for root in range(len(neighbors)):
+        if not seen[root]:
+            seen[root] = 1
+            order.append(root)
+            k = len(order) - 1
+            while k < len(order):
+                for j in neighbors[order[k]]:
+                    if not seen[j]:
+                        seen[j] = 1
+                        order.append(j)
+                k += 1
+    return order
+
+
+class ShardedGraph:
+    """Read-only view of a graph split into shards, traversed by one worker process per shard.
+
+    Each shard owns a set of vertices and their outgoing edges. Traversals
+    proceed in rounds: every shard settles its own vertices with a local
+    run of Dijkstra's algorithm, and sends the labels it found for
+    vertices of other shards, one batch per destination shard, to be
+    applied in the next round. Labels only ever improve, so the
+    traversal ends in the first round in which no shard has a message to
+    send; the number of rounds depends on how often shortest paths cross
+    between shards, not on their length.
+    """
+
+    def __init__(self, g, k, labels=None, parallel=True):
+        """Split graph g into k shards.
+
+        labels optionally gives the shard of each vertex by its position in
+        g.vertices(), as computed by partition_graph (which is used by
+        default). If parallel is False, shards are run in this process,
+        one after another.
+        """
+        self._verts = list(g.vertices())
+        self._index = {v: i for i, v in enumerate(self._verts)}
+        self._edges = list(g.edges())
+        if labels is None:
+            labels = partition_graph(g, k)[0]
+        self._labels = labels
+        self._cut = [e for e in self._edges
+                     if labels[self._index[e.endpoints()[0]]] != labels[self._index[e.endpoints()[1]]]]
+        self._rounds = 0
+        shards = [_Shard() for _ in range(k)]
+        edge_id = {e: eid for eid, e in enumerate(self._edges)}
+        for u in self._verts:
+            i = self._index[u]
+            adjacent = []
+            for e in g.incident_edges(u):
+                j = self._index[e.opposite(u)]
+                adjacent.append((j, e.element(), edge_id[e], labels[j]))
+            shards[labels[i]].adjacent[i] = adjacent
+        if parallel:
+            self._shards = [_RemoteShard(shard) for shard in shards]
+        else:
+            self._shards = shards
+
+    # ------------------------- nonpublic utilities -------------------------
+    def _traverse(self, weighted, sources=(), spacing=0):
+        """Run rounds until no messages remain; return (best, via) maps by vertex position.
+
+        Each vertex in sources starts with label 0. If spacing is nonzero,
+        every vertex i also starts as a root with label i * spacing.
+        """
+        outboxes = self._call('begin', [(weighted, spacing)] * len(self._shards))
+        inboxes = self._route(outboxes)
+        for s in sources:
+            i = self._index[s]
+            inboxes[self._labels[i]].append((i, 0, -1))
+        self._rounds = 0
+        while any(inboxes):
+            self._rounds += 1
+            outboxes = self._call('relax', [(batch,) for batch in inboxes])
+            inboxes = self._route(outboxes)
+        best, via = {}, {}
+        for shard_best, shard_via in self._call('result', [()] * len(self._shards)):
+            best.update(shard_best)
+            via.update(shard_via)
+        return best, via
+
+    def _route(self, outboxes):
+        """Gather the batches that each shard sent into one inbox per destination shard."""
+        inboxes = [[] for _ in self._shards]
+        for outbox in outboxes:
+            for shard, batch in outbox.items():
+                inboxes[shard].extend(batch)
+        return inboxes
+
+    def _call(self, name, args):
+        """Call method name on every shard, with the corresponding tuple of args, and return the results."""
+        if isinstance(self._shards[0], _Shard):
+            return [getattr(shard, name)(*a) for shard, a in zip(self._shards, args)]
+        for shard, a in zip(self._shards, args):  # start every shard before waiting for any
+            shard.send(name, a)
+        return [shard.receive() for shard in self._shards]
+
+    # ------------------------- public ShardedGraph methods -------------------------
+    def shard_count(self):
+        """Return the number of shards."""
+        return len(self._shards)
+
+    def shard_of(self, v):
+        """Return the shard that owns vertex v."""
+        return self._labels[self._index[v]]
+
+    def cut_edges(self):
+        """Return the list of edges whose endpoints lie in different shards."""
+        return self._cut
+
+    def rounds(self):
+        """Return the number of message-exchange rounds used by the last traversal."""
+        return self._rounds
+
+    def bfs(self, s):
+        """Return dictionary mapping each vertex reachable from s to its number of edges from s."""
+        best, via = self._traverse(False, [s])
+        return {self._verts[i]: d for i, d in best.items()}
+
+    def bfs_complete(self):
+        """Perform BFS for entire graph and return forest as a dictionary.
+
+        Result maps each vertex v to the edge that was used to discover it
+        (vertices that are roots of a BFS tree are mapped to None), as for
+        bfs.BFS_complete: each tree is rooted at the first of its vertices
+        in g.vertices(). Every root search runs in the same rounds.
+        """
+        n = len(self._verts)
+        best, via = self._traverse(False, spacing=n + 1)  # labels order by root first, then distance
+        return {self._verts[i]: self._edges[k] if k >= 0 else None for i, k in via.items()}
+
+    def shortest_path_lengths(self, s):
+        """Compute shortest-path distances from s to reachable vertices, as shortest_paths.shortest_path_lengths."""
+        best, via = self._traverse(True, [s])
+        return {self._verts[i]: d for i, d in best.items()}
+
+    def close(self):
+        """Stop the worker processes."""
+        for shard in self._shards:
+            if isinstance(shard, _RemoteShard):
+                shard.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class _Shard:
+    """The vertices owned by one shard, their outgoing edges, and their labels in the current traversal."""
+
+    def __init__(self):
+        self.adjacent = {}  # (neighbor, weight, edge id, neighbor's shard) for each edge leaving an owned vertex
+        self.best = {}
+        self.via = {}
+        self.weighted = True
+
+    def begin(self, weighted, spacing):
+        """Forget the last traversal; if spacing is nonzero, make every owned vertex a root.
+
+        Roots are searched from in order, skipping those already reached
+        from an earlier root, whose labels no later root can improve.
+        """
+        self.weighted = weighted
+        self.best, self.via = {}, {}
+        outbox = {}
+        if spacing:
+            for i in sorted(self.adjacent):
+                if i not in self.best:
+                    self.best[i] = i * spacing
+                    self.via[i] = -1
+                    self._settle([(i * spacing, i)], outbox)
+        return self._batches(outbox)
+
+    def relax(self, batch):
+        """Apply a batch of (vertex, label, edge id) messages and settle the owned vertices.
+
+        Return a dictionary mapping each other shard to the batch of
+        messages for it.
+        """
+        best, via = self.best, self.via
+        heap = []
+        for i, key, k in batch:
+            if key < best.get(i, key + 1):
+                best[i] = key
+                via[i] = k
+                heap.append((key, i))
+        heapify(heap)
+        outbox = {}
+        self._settle(heap, outbox)
+        return self._batches(outbox)
+
+    def _settle(self, heap, outbox):
+        """Run Dijkstra's algorithm over the owned vertices from the (label, vertex) heap.
+
+        The best label found for each vertex of another shard is recorded
+        in outbox, which maps each shard to a dictionary of them.
+        """
+        best, via, adjacent, weighted = self.best, self.via, self.adjacent, self.weighted
+        while heap:
+            key, i = heappop(heap)
+            if key > best[i]:
+                continue  # stale entry
+            for j, w, k, shard in adjacent[i]:
+                label = key + (w if weighted else 1)
+                if j in adjacent:
+                    if label < best.get(j, label + 1):
+                        best[j] = label
+                        via[j] = k
+                        heappush(heap, (label, j))
+                else:
+                    messages = outbox.setdefault(shard, {})
+                    if label < messages.get(j, (label + 1,))[0]:
+                        messages[j] = (label, k)
+
+    @staticmethod
+    def _batches(outbox):
+        """Return the messages of outbox as a list of (vertex, label, edge id) for each shard."""
+        return {shard: [(j, label, k) for j, (label, k) in messages.items()]
+                for shard, messages in outbox.items()}
+
+    def result(self):
+        """Return the (best, via) labels of the owned vertices reached."""
+        return self.best, self.via
+
+
+class _RemoteShard:
+    """A _Shard running in its own worker process, driven through a pipe."""
+
+    def __init__(self, shard):
+        self._conn, child = Pipe()
+        self._process = Process(target=_serve, args=(child, shard), daemon=True)
+        self._process.start()
+        child.close()
+
+    def send(self, name, args):
+        self._conn.send((name, args))
+
+    def receive(self):
+        return self._conn.recv()
+
+    def close(self):
+        self._conn.send(None)
+        self._process.join()
+        self._conn.close()
+
+
+def _serve(conn, shard):
+    """Worker process loop: run each requested method of shard and send back its result."""
+    while True:
+        request = conn.recv()
+        if request is None:
+            break
+        name, args = request
+        conn.send(getattr(shard, name)(*args))
+    conn.close()
+
+
+if __name__ == '__main__':
+    from .graph_examples import figure_14_15 as example
+
+    g = example()
+    labels, cut = partition_graph(g, 2, seed=1)
+    print("Cut edges:", sorted(str(e) for e in cut))
+    with ShardedGraph(g, 2, labels) as sharded:
+        src = next(iter(g.vertices()))
+        d = sharded.shortest_path_lengths(src)
+        print("Distances from", src, {str(v): d[v] for v in d}, "in", sharded.rounds(), "rounds")
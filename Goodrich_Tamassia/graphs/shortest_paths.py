@@ -18,17 +18,37 @@
 #
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
+from collections import deque
+from heapq import heapify, heappop, heappush
+from itertools import count
+
 from priority_queues.adaptable_pq import AdaptableHeapPriorityQueue
 
 
-def shortest_path_lengths(g, src):
+def shortest_path_lengths(g, src, engine='adaptable', outgoing=True):
     """Compute shortest-path distances from src to reachable vertices of g.
 
     Graph g can be undirected or directed, but must be weighted such that
     e.element() returns a numeric weight for each edge e.
 
+    The engine selects the priority queue used by Dijkstra's algorithm:
+    'adaptable' enters every vertex into an adaptable heap up front, 'heap'
+    pushes only discovered vertices onto a binary heap and skips stale
+    entries, and 'radix' uses a radix heap, which requires nonnegative
+    integer weights.
+
+    If outgoing is False, paths follow incoming edges of a directed graph,
+    so the result gives the distance from each vertex to src instead.
+
     Return dictionary mapping each reachable vertex to its distance from src.
     """
+    if engine not in _ENGINES:
+        raise ValueError('unknown engine: ' + repr(engine))
+    return _ENGINES[engine](g, src, outgoing)
+
+
+def _adaptable_lengths(g, src, outgoing=True):
+    """Dijkstra's algorithm using an adaptable priority queue with locators."""
     d = {}  # d[v] is upper bound from s to v
     cloud = {}  # map reachable v to its d[v] value
     pq = AdaptableHeapPriorityQueue()  # vertex v will have key d[v]
@@ -45,9 +65,11 @@ def shortest_path_lengths(g, src):
 
     while not pq.is_empty():
         key, u = pq.remove_min()
+        if key == float('inf'):
+            break  # all remaining vertices are unreachable
         cloud[u] = key  # its correct d[u] value
         del pqlocator[u]  # u is no longer in pq
-        for e in g.incident_edges(u):  # outgoing edges (u,v)
+        for e in g.incident_edges(u, outgoing):  # outgoing edges (u,v)
             v = e.opposite(u)
             if v not in cloud:
                 # perform relaxation step on edge (u,v)
@@ -59,6 +81,239 @@ def shortest_path_lengths(g, src):
     return cloud  # only includes reachable vertices
 
 
+def _heap_lengths(g, src, outgoing=True):
+    """Dijkstra's algorithm using a binary heap with lazy deletion."""
+    return _heap_search(g, [src], outgoing)[0]
+
+
+def _heap_search(g, sources, outgoing=True, target=None, heuristic=None, weight=None):
+    """Run Dijkstra's algorithm from sources using a binary heap with lazy deletion.
+
+    Every vertex of sources starts at distance 0. If target is given, the
+    search stops as soon as it is settled. If heuristic is given, it must
+    return a lower bound on the distance from a vertex to target, and
+    vertices are settled in order of distance plus heuristic (A* search).
+    If weight is given, weight(e, u, v) is used as the length of edge e
+    from u to v in place of e.element().
+
+    Return (cloud, parent), where cloud maps each settled vertex to its
+    distance, in the order settled, and parent maps each discovered vertex
+    to its predecessor (None for sources).
+    """
+    d = {}  # d[v] is upper bound from sources to v, for discovered v
+    parent = {}
+    cloud = {}
+    tiebreak = count()  # vertices themselves are not comparable
+    pq = []
+    for s in sources:
+        d[s] = 0
+        parent[s] = None
+        pq.append((heuristic(s) if heuristic else 0, next(tiebreak), s))
+    heapify(pq)
+    while pq:
+        _, _, u = heappop(pq)
+        if u in cloud:
+            continue  # stale entry for a vertex that was already settled
+        key = cloud[u] = d[u]
+        if u is target:
+            break
+        for e in g.incident_edges(u, outgoing):
+            v = e.opposite(u)
+            if v not in cloud:
+                dist = key + (e.element() if weight is None else weight(e, u, v))
+                if v not in d or dist < d[v]:
+                    d[v] = dist
+                    parent[v] = u
+                    heappush(pq, (dist + heuristic(v) if heuristic else dist, next(tiebreak), v))
+    return cloud, parent
+
+
+def _radix_lengths(g, src, outgoing=True):
+    """Dijkstra's algorithm using a radix heap; weights must be nonnegative integers.
+
+    Each pending entry sits in the bucket given by the highest bit in which
+    its key differs from the last key removed, so buckets are revisited only
+    O(log C) times per entry, where C is the largest weight.
+    """
+    d = {src: 0}
+    cloud = {}
+    buckets = [[(0, src)]]  # bucket i holds keys differing from last in bit i-1
+    last = 0  # the most recently removed key
+    pending = 1
+    while pending:
+        if not buckets[0]:
+            # move the smallest key in the first nonempty bucket to bucket 0
+            i = 1
+            while not buckets[i]:
+                i += 1
+            entries = buckets[i]
+            buckets[i] = []
+            last = min(entry[0] for entry in entries)
+            for entry in entries:
+                b = (entry[0] ^ last).bit_length()
+                buckets[b].append(entry)
+        key, u = buckets[0].pop()
+        pending -= 1
+        if u in cloud:
+            continue
+        cloud[u] = key
+        for e in g.incident_edges(u, outgoing):
+            v = e.opposite(u)
+            if v not in cloud:
+                wgt = e.element()
+                if not isinstance(wgt, int) or wgt < 0:
+                    raise ValueError('radix engine requires nonnegative integer weights')
+                dist = key + wgt
+                if v not in d or dist < d[v]:
+                    d[v] = dist
+                    b = (dist ^ last).bit_length()
+                    while len(buckets) <= b:
+                        buckets.append([])
+                    buckets[b].append((dist, v))
+                    pending += 1
+    return cloud
+
+
+_ENGINES = {
+    'adaptable': _adaptable_lengths,
+    'heap': _heap_lengths,
+    'radix': _radix_lengths,
+}
+
+
+def shortest_path(g, s, t, bidirectional=False):
+    """Compute a shortest path from vertex s to vertex t of weighted graph g.
+
+    The search stops as soon as t is settled rather than exploring the
+    whole reachable graph. If bidirectional is True, searches proceed
+    alternately forward from s along outgoing edges and backward from t
+    along incoming edges, stopping once they meet.
+
+    Return a (distance, path) tuple, where path is the list of vertices
+    from s to t; return (float('inf'), []) if t is not reachable from s.
+    """
+    if s is t:
+        return 0, [s]
+    if bidirectional:
+        return _bidirectional_path(g, s, t)
+    cloud, parent = _heap_search(g, [s], target=t)
+    if t not in cloud:
+        return float('inf'), []
+    return cloud[t], _trace(parent, t)
+
+
+def _bidirectional_path(g, s, t):
+    """Bidirectional Dijkstra search used by shortest_path."""
+    # index 0 holds the forward search from s, index 1 the backward search from t
+    d = ({s: 0}, {t: 0})
+    parent = ({s: None}, {t: None})
+    cloud = (set(), set())
+    tiebreak = count()
+    pq = ([(0, next(tiebreak), s)], [(0, next(tiebreak), t)])
+    best, meet = float('inf'), None  # shortest s-t path seen so far, and a vertex on it
+    side = 0
+    while pq[0] and pq[1]:
+        if pq[0][0][0] + pq[1][0][0] >= best:
+            break  # no path through unsettled vertices can be shorter
+        key, _, u = heappop(pq[side])
+        if u not in cloud[side]:
+            cloud[side].add(u)
+            for e in g.incident_edges(u, side == 0):  # outgoing forward, incoming backward
+                v = e.opposite(u)
+                if v not in cloud[side]:
+                    dist = key + e.element()
+                    if v not in d[side] or dist < d[side][v]:
+                        d[side][v] = dist
+                        parent[side][v] = u
+                        heappush(pq[side], (dist, next(tiebreak), v))
+                    if v in d[1 - side] and d[side][v] + d[1 - side][v] < best:
+                        best, meet = d[side][v] + d[1 - side][v], v
+        side = 1 - side
+    if meet is None:
+        return float('inf'), []
+    path = _trace(parent[0], meet)
+    walk = parent[1][meet]
+    while walk is not None:  # follow backward search from meet to t
+        path.append(walk)
+        walk = parent[1][walk]
+    return best, path
+
+
+def _trace(parent, v):
+    """Return the list of vertices from the root of the parent map to v."""
+    path = []
+    while v is not None:
+        path.append(v)
+        v = parent[v]
+    path.reverse()
+    return path
+
+
+def bellman_ford(g, src):
+    """Compute shortest-path distances from src, allowing negative edge weights.
+
+    Uses the queue-based form of the Bellman-Ford algorithm, which
+    relaxes the edges of a vertex only after its distance has improved.
+
+    Return dictionary mapping each reachable vertex to its distance from src.
+    Raise a ValueError if a negative-weight cycle is reachable from src
+    (in an undirected graph, any negative edge forms such a cycle).
+    """
+    return _queued_relaxation(g, [src])
+
+
+def _queued_relaxation(g, sources):
+    """Queue-based Bellman-Ford from every vertex of sources at distance zero."""
+    n = g.vertex_count()
+    d = {}
+    hops = {}  # number of edges on the path giving d[v]
+    queue = deque()
+    for s in sources:
+        d[s] = 0
+        hops[s] = 0
+        queue.append(s)
+    waiting = set(queue)  # vertices currently in the queue
+    while queue:
+        u = queue.popleft()
+        waiting.discard(u)
+        for e in g.incident_edges(u):
+            v = e.opposite(u)
+            dist = d[u] + e.element()
+            if v not in d or dist < d[v]:
+                d[v] = dist
+                hops[v] = hops[u] + 1
+                if hops[v] >= n:  # a simple path has fewer than n edges
+                    raise ValueError('graph has a negative-weight cycle')
+                if v not in waiting:
+                    waiting.add(v)
+                    queue.append(v)
+    return d
+
+
+def all_pairs_shortest_paths(g):
+    """Generate shortest-path distances between all pairs of vertices of g using Johnson's algorithm.
+
+    Edge weights may be negative. A single Bellman-Ford pass computes a
+    potential h for every vertex such that each reweighted edge
+    w(u,v) + h[u] - h[v] is nonnegative, after which one Dijkstra run per
+    vertex gives its distances. This takes O(nm log n) time rather than
+    the O(n^3) of the Floyd-Warshall approach.
+
+    Yield a (u, distances) pair for each vertex u in turn, where distances
+    maps each vertex reachable from u to its distance, so that only one row
+    is held in memory at a time. Raise a ValueError if g has a
+    negative-weight cycle.
+    """
+    h = _queued_relaxation(g, list(g.vertices()))  # as if from a virtual source
+
+    def reweighted(e, x, y):  # nonnegative for every edge (x,y)
+        return e.element() + h[x] - h[y]
+
+    for u in g.vertices():
+        d = _heap_search(g, [u], weight=reweighted)[0]
+        yield u, {v: dist - h[u] + h[v] for v, dist in d.items()}
+
+
 def shortest_path_tree(g, s, d):
     """Reconstruct shortest-path tree rooted at vertex s, given distance map d.
 
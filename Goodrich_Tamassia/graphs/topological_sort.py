@@ -19,6 +19,9 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+from concurrent.futures import as_completed
+
+
 def topological_sort(g):
     """Return a list of verticies of directed acyclic graph g in topological order.
 
@@ -42,6 +45,71 @@ def topological_sort(g):
     return topo
 
 
+def topological_levels(g):
+    """Return the vertices of directed acyclic graph g grouped into levels.
+
+    Level 0 holds the vertices with no incoming edges, and each later level
+    those whose predecessors all lie in earlier levels, so the vertices of
+    a level are mutually independent and may be processed concurrently.
+
+    If graph g has a cycle, the result will be incomplete.
+    """
+    levels = []
+    incount = {}
+    level = []
+    for u in g.vertices():
+        incount[u] = g.degree(u, False)
+        if incount[u] == 0:
+            level.append(u)
+    while len(level) > 0:
+        levels.append(level)
+        next_level = []
+        for u in level:
+            for e in g.incident_edges(u):
+                v = e.opposite(u)
+                incount[v] -= 1
+                if incount[v] == 0:
+                    next_level.append(v)
+        level = next_level
+    return levels
+
+
+def critical_path(g):
+    """Compute earliest start times in directed acyclic graph g, whose edge elements are durations.
+
+    An edge (u,v) with element w means v may not start until w time units
+    after u starts; a None element counts as zero.
+
+    Return a (length, earliest) tuple, where earliest maps each vertex to
+    its earliest start time and length is the largest of those times.
+    """
+    earliest = {}
+    for level in topological_levels(g):
+        for u in level:
+            start = earliest.setdefault(u, 0)
+            for e in g.incident_edges(u):
+                v = e.opposite(u)
+                finish = start + (e.element() or 0)
+                if finish > earliest.get(v, 0):
+                    earliest[v] = finish
+    return max(earliest.values(), default=0), earliest
+
+
+def run_levels(g, task, executor):
+    """Run task on the element of every vertex of directed acyclic graph g, level by level.
+
+    The calls for one level are submitted together to executor (for
+    instance a ThreadPoolExecutor or ProcessPoolExecutor), and the next
+    level starts once they have all finished.
+
+    Generate a (vertex, result) pair for each call as soon as it completes.
+    """
+    for level in topological_levels(g):
+        futures = {executor.submit(task, v.element()): v for v in level}
+        for future in as_completed(futures):
+            yield futures[future], future.result()
+
+
 if __name__ == '__main__':
     from .graph_examples import figure_14_12 as example
 
@@ -50,3 +118,4 @@ if __name__ == '__main__':
     print("Number of edges is", g.edge_count())
     topo = topological_sort(g)
     print("Topo order", [str(v) for v in topo])
+    print("Levels", [[str(v) for v in level] for level in topological_levels(g)])
@@ -21,6 +21,9 @@
 
 from copy import deepcopy
 
+from graphs.csr_graph import as_csr
+from graphs.scc import _tarjan
+
 
 def floyd_warshall(g):
     """Return a new graph that is the transitive closure of g."""
@@ -40,6 +43,79 @@ def floyd_warshall(g):
     return closure
 
 
+class ReachabilityIndex:
+    """Compact answer to reachability queries, with one bitset row per vertex or component."""
+
+    def __init__(self, index, rows, label=None):
+        """Do not call constructor directly. Use bitset_closure."""
+        self._index = index  # map from vertex to its index
+        self._rows = rows  # rows[i] has bit j set if index j is reachable from index i
+        self._label = label  # component of each vertex index, if rows are per component
+
+    def _position(self, v):
+        """Return the row/bit position of vertex v."""
+        i = self._index[v]
+        return i if self._label is None else self._label[i]
+
+    def reachable(self, u, v):
+        """Return True if there is a directed path from u to v (every vertex reaches itself)."""
+        return (self._rows[self._position(u)] >> self._position(v)) & 1 == 1
+
+    def reach_count(self, u):
+        """Return the number of vertices reachable from u, including u itself."""
+        if self._label is None:
+            return bin(self._rows[self._index[u]]).count('1')
+        row = self._rows[self._position(u)]
+        return sum(1 for c in self._label if (row >> c) & 1)
+
+
+def bitset_closure(g, condense=False):
+    """Compute the transitive closure of g and return it as a ReachabilityIndex.
+
+    Each row of the closure is a Python integer used as a bitset, so an
+    entire row is merged with a single OR. By default this runs the
+    Floyd-Warshall recurrence over rows: for each k, every row containing
+    k absorbs row k, for O(n^2) row operations in total.
+
+    If condense is True, the strongly connected components are found first
+    and rows are kept only for components. They are then filled in
+    reverse topological order with one OR per edge between components,
+    which is far cheaper for sparse or nearly acyclic graphs.
+    """
+    csr = as_csr(g)
+    n = csr.vertex_count()
+    offsets, targets = csr._offsets, csr._targets
+    index = {v: i for i, v in enumerate(g.vertices())}
+    if not condense:
+        rows = []
+        for i in range(n):
+            row = 1 << i
+            for k in range(offsets[i], offsets[i + 1]):
+                row |= 1 << targets[k]
+            rows.append(row)
+        for k in range(n):
+            bit, row_k = 1 << k, rows[k]
+            for i in range(n):
+                if rows[i] & bit:
+                    rows[i] |= row_k
+        return ReachabilityIndex(index, rows)
+
+    count, label = _tarjan(n, offsets, targets)
+    members = [[] for _ in range(count)]
+    for i in range(n):
+        members[label[i]].append(i)
+    rows = []
+    for c in range(count):  # components are numbered in reverse topological order
+        row = 1 << c
+        for i in members[c]:
+            for k in range(offsets[i], offsets[i + 1]):
+                successor = label[targets[k]]
+                if successor != c:  # an earlier component, whose row is complete
+                    row |= rows[successor]
+        rows.append(row)
+    return ReachabilityIndex(index, rows, label)
+
+
 if __name__ == '__main__':
     from graph_examples import figure_14_11 as example
 
@@ -53,9 +53,10 @@ class HeapPriorityQueue(BasePriorityQueue):
 
     def _downheap(self, j):
         if self._has_right(j):
-            c = min(self._data[self._left(j)], self._data[self._right(j)])
+            left, right = self._left(j), self._right(j)
+            c = left if self._data[left] < self._data[right] else right
         elif self._has_left(j):
-            c = self._data[self._left(j)]
+            c = self._left(j)
         else:
             return
 